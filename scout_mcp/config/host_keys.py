@@ -31,6 +31,8 @@ class HostKeyVerifier:
         self.strict_checking = strict_checking
         self._known_hosts_raw = known_hosts_path
         self._resolved: str | None | Exception = None  # Lazy cache
+        # Tracked separately: None is also a valid resolved result (disabled)
+        self._is_resolved = False
 
     def _resolve_known_hosts(self, env_value: str | None) -> str | None:
         """Resolve known_hosts path with security defaults.
@@ -111,12 +113,13 @@ class HostKeyVerifier:
             FileNotFoundError: If strict mode and file missing
         """
         # Lazy evaluation on first access
-        if self._resolved is None:
+        if not self._is_resolved:
             try:
                 self._resolved = self._resolve_known_hosts(self._known_hosts_raw)
             except Exception as e:
                 # Cache the exception for consistent behavior
                 self._resolved = e
+            self._is_resolved = True
 
         # Raise cached exception if resolution failed
         if isinstance(self._resolved, Exception):
@@ -130,8 +133,11 @@ class HostKeyVerifier:
         Returns:
             True if verification is enabled
         """
-        # Try to get the path, return False if it fails or is None
-        try:
-            return self.get_known_hosts_path() is not None
-        except Exception:
-            return False
+        # Resolve once; afterwards this is an attribute check rather than
+        # re-raising and catching a cached resolution error on every call
+        if not self._is_resolved:
+            try:
+                self.get_known_hosts_path()
+            except Exception:
+                return False
+        return isinstance(self._resolved, str)
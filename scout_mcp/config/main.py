@@ -31,7 +31,15 @@ class Config:
     settings: Settings
     parser: SSHConfigParser
     host_keys: HostKeyVerifier
-    _hosts_cache: dict[str, SSHHost] = field(default_factory=dict, init=False, repr=False)
+    _hosts_cache: dict[str, SSHHost] | None = field(
+        default=None, init=False, repr=False
+    )
+    _hosts_signature: tuple[int, int] | None = field(
+        default=None, init=False, repr=False
+    )
+    _host_endpoints: dict[str, tuple[str, int]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     @classmethod
     def from_env(cls) -> "Config":
@@ -42,16 +50,9 @@ class Config:
         """
         settings = Settings.from_env()
 
-        # Get allowlist/blocklist from environment
-        allowlist_str = os.getenv("SCOUT_ALLOWLIST", "").strip()
-        allowlist = [h.strip() for h in allowlist_str.split(",") if h.strip()] if allowlist_str else None
-
-        blocklist_str = os.getenv("SCOUT_BLOCKLIST", "").strip()
-        blocklist = [h.strip() for h in blocklist_str.split(",") if h.strip()] if blocklist_str else None
-
         parser = SSHConfigParser(
-            allowlist=allowlist,
-            blocklist=blocklist,
+            allowlist=cls._get_list_env("SCOUT_ALLOWLIST"),
+            blocklist=cls._get_list_env("SCOUT_BLOCKLIST"),
         )
 
         host_keys = HostKeyVerifier(
@@ -110,18 +111,77 @@ class Config:
             return default
         return value.lower() != "false"
 
+    @staticmethod
+    def _get_list_env(key: str) -> list[str] | None:
+        """Get comma-separated list from environment.
+
+        Args:
+            key: Environment variable key
+
+        Returns:
+            Non-empty stripped entries, or None if unset or empty
+        """
+        value = os.getenv(key)
+        if not value:
+            return None
+        items = [item for item in map(str.strip, value.split(",")) if item]
+        return items or None
+
     def get_hosts(self) -> dict[str, SSHHost]:
         """Get SSH hosts from config.
 
-        Lazy loads and caches hosts on first call.
+        Lazy loads and caches hosts on first call. The cache is keyed on the
+        SSH config file's (mtime_ns, size), like the parser's own cache, so
+        edits are picked up on the next call.
 
         Returns:
             Dictionary of hostname to SSHHost
         """
-        if not self._hosts_cache:
+        signature = self._ssh_config_signature()
+        if self._hosts_cache is None or signature != self._hosts_signature:
             self._hosts_cache = self.parser.parse()
+            self._hosts_signature = signature
+            self._host_endpoints = {
+                name: (host.hostname, host.port)
+                for name, host in sorted(self._hosts_cache.items())
+            }
         return self._hosts_cache
 
+    def get_host_endpoints(self) -> dict[str, tuple[str, int]]:
+        """Get connection endpoints for all hosts, ordered by host name.
+
+        Built once per parse of the SSH config, so host listings do not
+        re-sort and rebuild it on every request. Callers must not mutate it.
+
+        Returns:
+            Dictionary of hostname to (hostname, port)
+        """
+        return self.get_hosts_and_endpoints()[1]
+
+    def get_hosts_and_endpoints(
+        self,
+    ) -> tuple[dict[str, SSHHost], dict[str, tuple[str, int]]]:
+        """Get hosts and their endpoints from the same parse of the SSH config.
+
+        Calling get_hosts() and get_host_endpoints() separately checks the
+        file twice, so an edit in between could leave an endpoint with no
+        matching host. Use this when both are needed together.
+
+        Returns:
+            Tuple of (hosts, endpoints) as returned by get_hosts() and
+            get_host_endpoints()
+        """
+        hosts = self.get_hosts()
+        return hosts, self._host_endpoints
+
+    def _ssh_config_signature(self) -> tuple[int, int] | None:
+        """Get the SSH config file's (mtime_ns, size), or None if unreadable."""
+        try:
+            st = os.stat(self.parser.config_path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
     def get_host(self, name: str) -> SSHHost | None:
         """Get host by name.
 
@@ -6,6 +6,9 @@ Reads ~/.ssh/config and extracts host definitions with allowlist/blocklist filte
 import logging
 import os
 import re
+import sys
+from dataclasses import replace
+from fnmatch import translate
 from pathlib import Path
 
 from scout_mcp.models import SSHHost
@@ -14,6 +17,78 @@ from scout_mcp.utils.hostname import is_localhost_target
 logger = logging.getLogger(__name__)
 
 
+# Parsed hosts per (path, allowlist, blocklist, home dir), stored with the
+# file's (mtime_ns, size) at parse time. The home dir is part of the key since
+# IdentityFile "~" is expanded during the parse. Shared across parser
+# instances so repeated Config objects over an unchanged file (e.g. per-test
+# fixtures) skip the read and parse; a changed file replaces its entry instead
+# of adding one
+_CacheKey = tuple[str, frozenset[str] | None, frozenset[str], str]
+_parse_cache: dict[_CacheKey, tuple[int, int, dict[str, SSHHost]]] = {}
+_PARSE_CACHE_MAX = 32
+_READ_CHUNK = 64 * 1024
+
+
+def _read_fd(fd: int, size: int) -> str:
+    """Read an open file to EOF, sizing the first read from fstat.
+
+    Skips the buffered text layer used by Path.read_text(); undecodable
+    bytes are replaced rather than raising. Keeps reading after a short
+    read, and when fstat reports 0 (FIFOs, /proc, process substitution).
+
+    Args:
+        fd: Open file descriptor
+        size: File size from fstat, used as a hint
+
+    Returns:
+        File contents decoded as UTF-8
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    chunks = []
+    chunk_size = max(size, _READ_CHUNK)
+    while chunk := os.read(fd, chunk_size):
+        chunks.append(chunk)
+        chunk_size = _READ_CHUNK
+    return b"".join(chunks).decode("utf-8", "replace")
+
+
+def _copy_hosts(hosts: dict[str, SSHHost]) -> dict[str, SSHHost]:
+    """Copy cached hosts so no two Config objects share SSHHost instances.
+
+    Args:
+        hosts: Cached host mapping
+
+    Returns:
+        New mapping of shallow SSHHost copies
+    """
+    return {name: replace(host) for name, host in hosts.items()}
+
+
+def _compile_filter(
+    patterns: set[str] | None,
+) -> tuple[frozenset[str], re.Pattern[str] | None]:
+    """Split host filters into exact names and one compiled glob regex.
+
+    Plain names (the common case) are checked with a set lookup; only
+    entries containing glob characters go into the regex alternation.
+
+    Args:
+        patterns: Host names or shell-style globs
+
+    Returns:
+        Exact names, and a compiled alternation of the globs or None
+    """
+    if not patterns:
+        return frozenset(), None
+    globs = sorted(p for p in patterns if any(c in p for c in "*?["))
+    names = frozenset(patterns.difference(globs))
+    if not globs:
+        return names, None
+    return names, re.compile("|".join(translate(p) for p in globs))
+
+
 class SSHConfigParser:
     """Parser for SSH config files.
 
@@ -40,21 +115,40 @@ class SSHConfigParser:
         self.config_path = Path(config_path)
         self.allowlist = set(allowlist) if allowlist else None
         self.blocklist = set(blocklist) if blocklist else set()
+        self._allow_names, self._allow_re = _compile_filter(self.allowlist)
+        self._block_names, self._block_re = _compile_filter(self.blocklist)
+        self._filter_key = (
+            str(self.config_path),
+            frozenset(self.allowlist) if self.allowlist is not None else None,
+            frozenset(self.blocklist),
+        )
 
     def parse(self) -> dict[str, SSHHost]:
         """Parse SSH config and return host definitions.
 
         Returns:
-            Dictionary mapping hostname to SSHHost objects
+            Dictionary mapping hostname to SSHHost objects, copied from the
+            cache so callers can't alter each other's hosts
         """
-        if not self.config_path.exists():
-            logger.warning("SSH config not found: %s", self.config_path)
-            return {}
-
+        cache_key: _CacheKey = (*self._filter_key, os.path.expanduser("~"))
         try:
-            content = self.config_path.read_text()
+            fd = os.open(self.config_path, os.O_RDONLY)
+            try:
+                st = os.fstat(fd)
+                signature = (st.st_mtime_ns, st.st_size)
+                cached = _parse_cache.get(cache_key)
+                if cached is not None and cached[:2] == signature:
+                    logger.debug("Using cached SSH config for %s", self.config_path)
+                    return _copy_hosts(cached[2])
+                content = _read_fd(fd, st.st_size)
+            finally:
+                os.close(fd)
             logger.debug("Reading SSH config from %s", self.config_path)
-        except (OSError, PermissionError) as e:
+        except FileNotFoundError:
+            logger.warning("SSH config not found: %s", self.config_path)
+            _parse_cache.pop(cache_key, None)
+            return {}
+        except OSError as e:
             logger.warning("Cannot read SSH config %s: %s", self.config_path, e)
             return {}
 
@@ -68,41 +162,38 @@ class SSHConfigParser:
             if not line or line.startswith("#"):
                 continue
 
-            # Match Host directive
-            host_match = re.match(r"^Host\s+(\S+)", line, re.IGNORECASE)
-            if host_match:
+            # Tokenize "Keyword value..." without regex; lines without a
+            # value (e.g. a bare "Host") are ignored
+            parts = line.split(None, 1)
+            if len(parts) < 2:
+                continue
+            key = parts[0].lower()
+            value = parts[1]
+
+            # Host directive
+            if key == "host":
                 # Save previous host if exists
                 if (
                     current_host
                     and current_host != "*"
                     and current_data.get("hostname")
                 ):
-                    if self._is_host_allowed(current_host):
-                        try:
-                            port = int(current_data.get("port", "22"))
-                        except ValueError:
-                            port = 22
-                        hosts[current_host] = SSHHost(
-                            name=current_host,
-                            hostname=current_data.get("hostname", ""),
-                            user=current_data.get("user", "root"),
-                            port=port,
-                            identity_file=current_data.get("identityfile"),
-                            is_localhost=is_localhost_target(current_host),
-                        )
-                current_host = host_match.group(1)
+                    hosts[current_host] = self._build_host(current_host, current_data)
+                # Interned: the alias becomes both the dict key and SSHHost.name
+                current_host = sys.intern(value.split(None, 1)[0])
                 # Skip wildcards
                 if "*" in current_host or "?" in current_host:
                     current_host = "*"
+                # Filtered-out hosts are dropped here, so their directives
+                # are never collected or expanded
+                elif not self._is_host_allowed(current_host):
+                    current_host = None
                 # Start with global defaults for each host (except Host *)
                 current_data = global_defaults.copy() if current_host != "*" else {}
                 continue
 
-            # Match key-value pairs
-            kv_match = re.match(r"^(\w+)\s+(.+)$", line)
-            if kv_match and current_host:
-                key = kv_match.group(1).lower()
-                value = kv_match.group(2)
+            # Key-value pairs (keywords are word characters only)
+            if current_host and key.replace("_", "a").isalnum():
                 # Expand tilde in identity file paths
                 if key == "identityfile":
                     value = os.path.expanduser(value)
@@ -113,26 +204,57 @@ class SSHConfigParser:
 
         # Save last host
         if current_host and current_host != "*" and current_data.get("hostname"):
-            if self._is_host_allowed(current_host):
-                try:
-                    port = int(current_data.get("port", "22"))
-                except ValueError:
-                    port = 22
-                hosts[current_host] = SSHHost(
-                    name=current_host,
-                    hostname=current_data.get("hostname", ""),
-                    user=current_data.get("user", "root"),
-                    port=port,
-                    identity_file=current_data.get("identityfile"),
-                    is_localhost=is_localhost_target(current_host),
-                )
+            hosts[current_host] = self._build_host(current_host, current_data)
 
         logger.info("Parsed %d hosts from %s", len(hosts), self.config_path)
-        return hosts
+        _parse_cache.pop(cache_key, None)
+        if len(_parse_cache) >= _PARSE_CACHE_MAX:
+            del _parse_cache[next(iter(_parse_cache))]
+        _parse_cache[cache_key] = (*signature, hosts)
+        return _copy_hosts(hosts)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached parse results.
+
+        Only needed when a config file is rewritten without changing its
+        mtime or size, e.g. in tests that edit files within one clock tick.
+        """
+        _parse_cache.clear()
+
+    @staticmethod
+    def _build_host(name: str, data: dict[str, str]) -> SSHHost:
+        """Build an SSHHost from a parsed Host block.
+
+        String fields are interned, since users and identity files usually
+        repeat across hosts.
+
+        Args:
+            name: Host alias from the Host directive
+            data: Lowercased keyword to value mapping for the block
+
+        Returns:
+            SSHHost for the block
+        """
+        try:
+            port = int(data.get("port", "22"))
+        except ValueError:
+            port = 22
+        identity_file = data.get("identityfile")
+        return SSHHost(
+            name=name,
+            hostname=sys.intern(data.get("hostname", "")),
+            user=sys.intern(data.get("user", "root")),
+            port=port,
+            identity_file=sys.intern(identity_file) if identity_file else None,
+            is_localhost=is_localhost_target(name),
+        )
 
     def _is_host_allowed(self, name: str) -> bool:
         """Check if host passes allowlist/blocklist filters.
 
+        Entries may be shell-style globs (e.g. ``prod-*``).
+
         Args:
             name: Host name to check
 
@@ -140,11 +262,12 @@ class SSHConfigParser:
             True if host is allowed
         """
         # Allowlist takes precedence
-        if self.allowlist:
-            return name in self.allowlist
+        if self.allowlist is not None:
+            return name in self._allow_names or (
+                self._allow_re is not None and self._allow_re.match(name) is not None
+            )
 
         # Check blocklist
-        if self.blocklist:
-            return name not in self.blocklist
-
-        return True
+        if name in self._block_names:
+            return False
+        return self._block_re is None or self._block_re.match(name) is None
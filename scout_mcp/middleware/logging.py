@@ -91,7 +91,9 @@ class LoggingMiddleware(ScoutMiddleware):
             self._format_args(args),
         )
 
-        if self.include_payloads and args:
+        # Payload serialization is eager, so skip it when DEBUG is filtered
+        log_payloads = self.include_payloads and self.logger.isEnabledFor(logging.DEBUG)
+        if log_payloads and args:
             self.logger.debug("    Args: %s", self._truncate(args))
 
         try:
@@ -114,7 +116,7 @@ class LoggingMiddleware(ScoutMiddleware):
                 self._format_duration(duration_ms),
             )
 
-            if self.include_payloads and result is not None:
+            if log_payloads and result is not None:
                 self.logger.debug("    Result: %s", self._truncate(result))
 
             return result
@@ -8,7 +8,7 @@ if TYPE_CHECKING:
     import asyncssh
 
 
-@dataclass
+@dataclass(slots=True)
 class SSHHost:
     """SSH host configuration."""
 
@@ -38,7 +38,7 @@ class SSHHost:
         return 22 if self.is_localhost else self.port
 
 
-@dataclass
+@dataclass(slots=True)
 class PooledConnection:
     """A pooled SSH connection with last-used timestamp."""
 
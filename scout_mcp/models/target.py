@@ -3,9 +3,13 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScoutTarget:
-    """Parsed scout target."""
+    """Parsed scout target.
+
+    Frozen so parse_target() can hand the same cached instance to every
+    caller.
+    """
 
     host: str | None
     path: str = ""
@@ -12,20 +12,20 @@ async def list_hosts_resource() -> str:
         and both host-specific and generic URI formats.
     """
     config = get_config()
-    hosts = config.get_hosts()
+    # One snapshot, so every endpoint has a matching host even if the SSH
+    # config changes mid-request; endpoints are pre-sorted by name
+    hosts, host_endpoints = config.get_hosts_and_endpoints()
 
     if not hosts:
         return "No SSH hosts configured."
 
-    # Build dict for concurrent checking
-    host_endpoints = {name: (host.hostname, host.port) for name, host in hosts.items()}
-
     # Check all hosts concurrently
     online_status = await check_hosts_online(host_endpoints, timeout=2.0)
 
     lines = ["Available SSH Hosts", "=" * 40, ""]
 
-    for name, host in sorted(hosts.items()):
+    for name in host_endpoints:
+        host = hosts[name]
         status = "online" if online_status.get(name) else "offline"
         status_icon = "\u2713" if online_status.get(name) else "\u2717"
         host_info = f"{host.user}@{host.hostname}:{host.port}"
@@ -43,7 +43,7 @@ async def list_hosts_resource() -> str:
     lines.append("Usage Examples:")
     lines.append("-" * 40)
 
-    example_hosts = list(sorted(hosts.keys()))[:2]
+    example_hosts = list(host_endpoints)[:2]
     for h in example_hosts:
         lines.append(f"  {h}://etc/hosts             (files)")
         lines.append(f"  {h}://docker                (list containers)")
@@ -11,7 +11,7 @@ from scout_mcp.services import (
     get_connection_with_retry,
     get_pool,
 )
-from scout_mcp.services.executors import cat_file, ls_dir, stat_path
+from scout_mcp.services.executors import ls_dir, stat_and_cat
 from scout_mcp.services.validation import validate_host
 from scout_mcp.ui import (
     create_directory_ui,
@@ -115,9 +115,13 @@ async def scout_resource(host: str, path: str) -> str | dict[str, Any]:
     except ConnectionError as e:
         raise ResourceError(str(e)) from e
 
-    # Determine if path is file or directory
+    # Determine if path is file or directory; files are read in the same call
     try:
-        path_type = await stat_path(conn, normalized_path)
+        path_type, contents, was_truncated = await stat_and_cat(
+            conn, normalized_path, config.max_file_size
+        )
+    except RuntimeError as e:
+        raise ResourceError(f"Failed to read {normalized_path}: {e}") from e
     except Exception as e:
         raise ResourceError(f"Cannot stat {normalized_path}: {e}") from e
 
@@ -133,14 +137,8 @@ async def scout_resource(host: str, path: str) -> str | dict[str, Any]:
             raise ResourceError(f"Failed to read {normalized_path}: {e}") from e
 
     # Handle files
-    try:
-        contents, was_truncated = await cat_file(
-            conn, normalized_path, config.max_file_size
-        )
-        if was_truncated:
-            contents += f"\n\n[truncated at {config.max_file_size} bytes]"
-    except Exception as e:
-        raise ResourceError(f"Failed to read {normalized_path}: {e}") from e
+    if was_truncated:
+        contents += f"\n\n[truncated at {config.max_file_size} bytes]"
 
     # Determine file type and return appropriate UI
     file_type = _detect_file_type(normalized_path)
@@ -14,6 +14,7 @@ from scout_mcp.services.executors import (
     find_files,
     ls_dir,
     run_command,
+    stat_and_cat,
     stat_path,
     tree_dir,
 )
@@ -44,6 +45,7 @@ __all__ = [
     "run_command",
     "set_config",
     "set_pool",
+    "stat_and_cat",
     "stat_path",
     "tree_dir",
 ]
@@ -1,6 +1,8 @@
 """SSH connection helper with automatic retry."""
 
+import asyncio
 import logging
+import random
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -11,6 +13,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Upper bound in seconds for the randomized pause before the retry
+RETRY_BASE_DELAY = 0.1
+
 
 class ConnectionError(Exception):
     """Failed to establish SSH connection after retry."""
@@ -30,6 +35,7 @@ class ConnectionError(Exception):
 async def get_connection_with_retry(
     ssh_host: "SSHHost",
     pool: "ConnectionPool",
+    retry_delay: float | None = None,
 ) -> "asyncssh.SSHClientConnection":
     """Get SSH connection with automatic one-time retry on failure.
 
@@ -37,12 +43,16 @@ async def get_connection_with_retry(
     of stale connections. If the first connection attempt fails, it will:
     1. Log a warning about the failure
     2. Remove the potentially stale connection from the pool
-    3. Attempt to connect one more time
-    4. Raise ConnectionError if the retry also fails
+    3. Wait a random delay in [0, retry_delay] (full jitter), so many
+       requests failing against one host do not retry in lockstep
+    4. Attempt to connect one more time
+    5. Raise ConnectionError if the retry also fails
 
     Args:
         ssh_host: SSH host configuration
         pool: Connection pool to use
+        retry_delay: Upper bound in seconds for the pause before retrying
+            (default: RETRY_BASE_DELAY, read at call time)
 
     Returns:
         Active SSH connection
@@ -61,6 +71,9 @@ async def get_connection_with_retry(
         )
         try:
             await pool.remove_connection(ssh_host.name)
+            if retry_delay is None:
+                retry_delay = RETRY_BASE_DELAY
+            await asyncio.sleep(random.uniform(0, retry_delay))
             conn = await pool.get_connection(ssh_host)
             logger.info("Retry connection to %s succeeded", ssh_host.name)
             return conn
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Final
 
 from scout_mcp.models import BroadcastResult, CommandResult
+from scout_mcp.utils.shell import quote_arg, quote_path
 
 if TYPE_CHECKING:
     import asyncssh
@@ -46,13 +47,22 @@ class TransferResult:
     bytes_transferred: int = 0
 
 
+def _utf8_len(text: str) -> int:
+    """Return the UTF-8 encoded size of text.
+
+    ASCII text (the common case for config and log files) is sized without
+    re-encoding it; str.isascii() is a constant-time flag check in CPython.
+    """
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
 async def stat_path(conn: "asyncssh.SSHClientConnection", path: str) -> str | None:
     """Determine if path is a file, directory, or doesn't exist.
 
     Returns:
         'file', 'directory', or None if path doesn't exist.
     """
-    cmd = f'stat -c "%F" {shlex.quote(path)} 2>/dev/null'
+    cmd = f'stat -c "%F" {quote_path(path)} 2>/dev/null'
     result = await conn.run(cmd, check=False)
 
     if result.returncode != 0:
@@ -89,7 +99,7 @@ async def cat_file(
     Raises:
         RuntimeError: If file cannot be read.
     """
-    result = await conn.run(f"head -c {max_size} {shlex.quote(path)}", check=False)
+    result = await conn.run(f"head -c {max_size} {quote_path(path)}", check=False)
 
     if result.returncode != 0:
         stderr = result.stderr
@@ -103,17 +113,76 @@ async def cat_file(
     if stdout is None:
         return ("", False)
 
+    # Check if file was truncated by comparing output size to max_size
     if isinstance(stdout, bytes):
+        was_truncated = len(stdout) >= max_size
         content = stdout.decode("utf-8", errors="replace")
     else:
         content = stdout
-
-    # Check if file was truncated by comparing output length to max_size
-    was_truncated = len(content.encode("utf-8")) >= max_size
+        was_truncated = _utf8_len(content) >= max_size
 
     return (content, was_truncated)
 
 
+async def stat_and_cat(
+    conn: "asyncssh.SSHClientConnection",
+    path: str,
+    max_size: int,
+) -> tuple[str | None, str, bool]:
+    """Stat a path and, if it is not a directory, read it in one round-trip.
+
+    Equivalent to stat_path() followed by cat_file(), but runs both in a
+    single remote shell invocation so reading a file costs one SSH
+    round-trip instead of two. The first output line is the stat file
+    type; everything after it is the file contents.
+
+    Returns:
+        Tuple of (path_type, contents, was_truncated). path_type is 'file',
+        'directory', or None if the path doesn't exist; contents is empty
+        unless path_type is 'file'.
+
+    Raises:
+        RuntimeError: If the path exists but the file cannot be read.
+    """
+    quoted = quote_path(path)
+    cmd = (
+        f't=$(stat -c "%F" {quoted} 2>/dev/null) || exit 1; '
+        f'printf "%s\\n" "$t"; '
+        f'[ "$t" = directory ] || head -c {max_size} {quoted}'
+    )
+    result = await conn.run(cmd, check=False)
+
+    stdout = result.stdout
+    if not stdout:
+        return (None, "", False)
+
+    # Measure the contents on the raw bytes, as cat_file does, since
+    # decoding replaces invalid sequences and changes the length
+    if isinstance(stdout, bytes):
+        raw_type, _, raw_content = stdout.partition(b"\n")
+        file_type = raw_type.decode("utf-8", errors="replace")
+        content = raw_content.decode("utf-8", errors="replace")
+        content_size = len(raw_content)
+    else:
+        file_type, _, content = stdout.partition("\n")
+        content_size = _utf8_len(content)
+
+    if "directory" in file_type.lower():
+        return ("directory", "", False)
+
+    if result.returncode != 0:
+        stderr = result.stderr
+        if isinstance(stderr, bytes):
+            error_msg = stderr.decode("utf-8", errors="replace")
+        else:
+            error_msg = stderr or ""
+        raise RuntimeError(f"Failed to read {path}: {error_msg}")
+
+    was_truncated = content_size >= max_size
+
+    return ("file", content, was_truncated)
+
+
 async def ls_dir(conn: "asyncssh.SSHClientConnection", path: str) -> str:
     """List directory contents with details.
 
@@ -123,7 +192,7 @@ async def ls_dir(conn: "asyncssh.SSHClientConnection", path: str) -> str:
     Raises:
         RuntimeError: If directory cannot be listed.
     """
-    result = await conn.run(f"ls -la {shlex.quote(path)}", check=False)
+    result = await conn.run(f"ls -la {quote_path(path)}", check=False)
 
     if result.returncode != 0:
         stderr = result.stderr
@@ -160,7 +229,7 @@ async def tree_dir(
     """
     # Try tree command first
     result = await conn.run(
-        f"tree -L {max_depth} --noreport {shlex.quote(path)} 2>/dev/null", check=False
+        f"tree -L {max_depth} --noreport {quote_path(path)} 2>/dev/null", check=False
     )
 
     if result.returncode == 0:
@@ -173,7 +242,7 @@ async def tree_dir(
 
     # Fall back to find
     find_cmd = (
-        f"find {shlex.quote(path)} -maxdepth {max_depth} -type f -o -type d "
+        f"find {quote_path(path)} -maxdepth {max_depth} -type f -o -type d "
         f"2>/dev/null | head -100"
     )
     result = await conn.run(find_cmd, check=False)
@@ -255,11 +324,11 @@ async def run_command(
 
     # Build safe command with proper quoting
     # Note: cd is safe here because working_dir is validated separately
-    quoted_dir = shlex.quote(working_dir)
-    quoted_cmd = shlex.quote(cmd)
+    quoted_dir = quote_path(working_dir)
+    quoted_cmd = quote_arg(cmd)
     full_command = f"cd {quoted_dir} && timeout {timeout} {quoted_cmd}"
     for arg in args:
-        full_command += f" {shlex.quote(arg)}"
+        full_command += f" {quote_arg(arg)}"
 
     result = await conn.run(full_command, check=False)
 
@@ -378,7 +447,7 @@ async def docker_logs(
     container = validate_container_name(container)
 
     ts_flag = "--timestamps" if timestamps else ""
-    cmd = f"docker logs --tail {tail} {ts_flag} {shlex.quote(container)} 2>&1"
+    cmd = f"docker logs --tail {tail} {ts_flag} {quote_arg(container)} 2>&1"
 
     result = await conn.run(cmd, check=False)
 
@@ -447,7 +516,7 @@ async def docker_inspect(
     Returns:
         True if container exists, False otherwise.
     """
-    quoted = shlex.quote(container)
+    quoted = quote_arg(container)
     cmd = f"docker inspect --format '{{{{.Name}}}}' {quoted} 2>/dev/null"
 
     result = await conn.run(cmd, check=False)
@@ -535,7 +604,7 @@ async def compose_config(
             return ("", None)
 
         # Read the config file
-        read_result = await conn.run(f"cat {shlex.quote(config_file)}", check=False)
+        read_result = await conn.run(f"cat {quote_path(config_file)}", check=False)
 
         if read_result.returncode != 0:
             return ("", config_file)
@@ -576,7 +645,7 @@ async def compose_logs(
     project = validate_project_name(project)
 
     ts_flag = "--timestamps" if timestamps else ""
-    cmd = f"docker compose -p {shlex.quote(project)} logs --tail {tail} {ts_flag} 2>&1"
+    cmd = f"docker compose -p {quote_arg(project)} logs --tail {tail} {ts_flag} 2>&1"
 
     result = await conn.run(cmd, check=False)
 
@@ -662,7 +731,7 @@ async def zfs_pool_status(
     Returns:
         Tuple of (status_output, pool_exists).
     """
-    cmd = f"zpool status {shlex.quote(pool)} 2>&1"
+    cmd = f"zpool status {quote_arg(pool)} 2>&1"
     result = await conn.run(cmd, check=False)
 
     stdout = result.stdout
@@ -693,7 +762,7 @@ async def zfs_datasets(
         List of dicts with 'name', 'used', 'avail', 'refer', 'mountpoint' keys.
     """
     if pool:
-        quoted_pool = shlex.quote(pool)
+        quoted_pool = quote_arg(pool)
         cmd = (
             f"zfs list -H -r -o name,used,avail,refer,mountpoint "
             f"{quoted_pool} 2>/dev/null"
@@ -748,7 +817,7 @@ async def zfs_snapshots(
     if dataset:
         cmd = (
             f"zfs list -H -t snapshot -r -o name,used,creation "
-            f"{shlex.quote(dataset)} 2>/dev/null | tail -{limit}"
+            f"{quote_arg(dataset)} 2>/dev/null | tail -{limit}"
         )
     else:
         cmd = (
@@ -855,9 +924,9 @@ async def find_files(
     max_depth = validate_depth(max_depth)
 
     # Build find command with proper quoting
-    type_flag = f"-type {shlex.quote(file_type)}" if file_type else ""
+    type_flag = f"-type {quote_arg(file_type)}" if file_type else ""
     cmd = (
-        f"find {shlex.quote(path)} -maxdepth {max_depth} -name {shlex.quote(pattern)} "
+        f"find {quote_path(path)} -maxdepth {max_depth} -name {quote_arg(pattern)} "
         f"{type_flag} 2>/dev/null | head -{max_results}"
     )
 
@@ -989,10 +1058,9 @@ async def broadcast_read(
                 )
 
             conn = await pool.get_connection(ssh_host)
-            path_type = await stat_path(conn, path)
+            path_type, content, _ = await stat_and_cat(conn, path, max_file_size)
 
             if path_type == "file":
-                content, _ = await cat_file(conn, path, max_file_size)
                 return BroadcastResult(
                     host=host_name, path=path, output=content, success=True
                 )
@@ -3,8 +3,10 @@
 Implements SSHConnectionPool protocol for dependency inversion.
 
 Locking Strategy:
-- `_meta_lock`: Protects _connections OrderedDict and _host_locks dict structure
-- Per-host locks: Protect connection creation/removal for specific hosts
+- `_meta_lock`: Protects _connections OrderedDict structure
+- Per-host locks: Protect connection creation/removal for specific hosts;
+  looked up without the meta-lock (get-or-create never awaits, so it is
+  atomic on the event loop)
 - Lock acquisition order: Always per-host lock first, then meta-lock if needed
 
 LRU Eviction:
@@ -62,8 +64,9 @@ class ConnectionPool(ISSHConnectionPool):
         self.max_size = max_size
         self._connections: OrderedDict[str, PooledConnection] = OrderedDict()
         self._host_locks: dict[str, asyncio.Lock] = {}
-        self._meta_lock = asyncio.Lock()  # Protects _connections and _host_locks
+        self._meta_lock = asyncio.Lock()  # Protects _connections
         self._cleanup_task: asyncio.Task[Any] | None = None
+        self._connections_created = 0
 
         # Cache known_hosts configuration
         self._known_hosts = known_hosts
@@ -87,19 +90,23 @@ class ConnectionPool(ISSHConnectionPool):
             max_size,
         )
 
-    async def _get_host_lock(self, host_name: str) -> asyncio.Lock:
+    def _get_host_lock(self, host_name: str) -> asyncio.Lock:
         """Get or create lock for a specific host.
 
+        Does not take the meta-lock: there is no await between lookup and
+        insert, so concurrent callers for different hosts never serialize
+        here and callers for the same host always get the same lock.
+
         Args:
             host_name: Name of the host to get lock for
 
         Returns:
             Lock for the specified host
         """
-        async with self._meta_lock:
-            if host_name not in self._host_locks:
-                self._host_locks[host_name] = asyncio.Lock()
-            return self._host_locks[host_name]
+        lock = self._host_locks.get(host_name)
+        if lock is None:
+            lock = self._host_locks[host_name] = asyncio.Lock()
+        return lock
 
     async def _evict_lru_if_needed(self) -> None:
         """Evict least recently used connections if at capacity.
@@ -129,7 +136,7 @@ class ConnectionPool(ISSHConnectionPool):
 
     async def get_connection(self, host: "SSHHost") -> asyncssh.SSHClientConnection:
         """Get or create a connection to the host."""
-        host_lock = await self._get_host_lock(host.name)
+        host_lock = self._get_host_lock(host.name)
 
         async with host_lock:
             pooled = self._connections.get(host.name)
@@ -213,6 +220,7 @@ class ConnectionPool(ISSHConnectionPool):
             # Add to pool under meta-lock for OrderedDict safety
             async with self._meta_lock:
                 self._connections[host.name] = PooledConnection(connection=conn)
+                self._connections_created += 1
                 # New connections go to end (most recently used)
                 self._connections.move_to_end(host.name)
 
@@ -231,6 +239,33 @@ class ConnectionPool(ISSHConnectionPool):
 
             return conn
 
+    async def warm(self, hosts: "list[SSHHost]") -> int:
+        """Open connections to several hosts concurrently ahead of use.
+
+        Moves the SSH handshake off the first request's critical path.
+        Failures are logged and skipped so one unreachable host does not
+        block warming the others.
+
+        Args:
+            hosts: Hosts to connect to.
+
+        Returns:
+            Number of hosts with a pooled connection after warming.
+        """
+        results = await asyncio.gather(
+            *(self.get_connection(host) for host in hosts),
+            return_exceptions=True,
+        )
+        warmed = 0
+        for host, result in zip(hosts, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Failed to pre-warm connection to %s: %s", host.name, result
+                )
+            else:
+                warmed += 1
+        return warmed
+
     async def _cleanup_loop(self) -> None:
         """Periodically clean up idle connections."""
         logger.debug("Cleanup loop started (interval=%ds)", self.idle_timeout // 2)
@@ -253,7 +288,7 @@ class ConnectionPool(ISSHConnectionPool):
         removed_count = 0
 
         for host_name in hosts_to_check:
-            host_lock = await self._get_host_lock(host_name)
+            host_lock = self._get_host_lock(host_name)
             async with host_lock:
                 pooled = self._connections.get(host_name)
                 if pooled and (pooled.last_used < cutoff or pooled.is_stale):
@@ -296,7 +331,7 @@ class ConnectionPool(ISSHConnectionPool):
         Args:
             host_name: Name of the host to remove.
         """
-        host_lock = await self._get_host_lock(host_name)
+        host_lock = self._get_host_lock(host_name)
         async with host_lock:
             if host_name in self._connections:
                 logger.info(
@@ -318,6 +353,16 @@ class ConnectionPool(ISSHConnectionPool):
         """Return the current number of connections in the pool."""
         return len(self._connections)
 
+    @property
+    def connections_created(self) -> int:
+        """Return the number of SSH connections opened over the pool's lifetime.
+
+        Concurrent requests for one host wait on its per-host lock and reuse
+        the connection the first request opened, so N simultaneous cold
+        requests to a host should raise this by exactly one.
+        """
+        return self._connections_created
+
     @property
     def active_hosts(self) -> list[str]:
         """Return list of hosts with active connections."""
@@ -12,10 +12,9 @@ from scout_mcp.services import (
 )
 from scout_mcp.services.executors import (
     beam_transfer,
-    cat_file,
     ls_dir,
     run_command,
-    stat_path,
+    stat_and_cat,
     tree_dir,
 )
 from scout_mcp.utils.ping import check_hosts_online
@@ -56,17 +55,18 @@ async def handle_hosts_list() -> str:
         Formatted host list with online/offline status
     """
     config = get_config()
-    hosts = config.get_hosts()
+    # One snapshot, so every endpoint has a matching host
+    hosts, host_endpoints = config.get_hosts_and_endpoints()
 
     if not hosts:
         return "No SSH hosts configured."
 
-    # Check online status concurrently
-    host_endpoints = {name: (host.hostname, host.port) for name, host in hosts.items()}
+    # Check online status concurrently (endpoints are pre-sorted by name)
     online_status = await check_hosts_online(host_endpoints, timeout=2.0)
 
     lines = ["Available hosts:"]
-    for name, host in sorted(hosts.items()):
+    for name in host_endpoints:
+        host = hosts[name]
         status_icon = "✓" if online_status.get(name) else "✗"
         status_text = "online" if online_status.get(name) else "offline"
         lines.append(
@@ -121,36 +121,6 @@ async def handle_command_execution(
         return f"Error: Command failed: {e}"
 
 
-async def handle_file_read(
-    ssh_host: "SSHHost",
-    path: str,
-) -> str:
-    """Read a file from remote host.
-
-    Args:
-        ssh_host: SSH host configuration
-        path: Path to file
-
-    Returns:
-        File contents or error message
-    """
-    config = get_config()
-
-    conn, error = await _get_connection(ssh_host)
-    if error:
-        return f"Error: {error}"
-
-    assert conn is not None  # For mypy - error check above ensures this
-
-    try:
-        contents, was_truncated = await cat_file(conn, path, config.max_file_size)
-        if was_truncated:
-            contents += f"\n\n[truncated at {config.max_file_size} bytes]"
-        return contents
-    except Exception as e:
-        return f"Error: {e}"
-
-
 async def handle_directory_list(
     ssh_host: "SSHHost",
     path: str,
@@ -181,34 +151,46 @@ async def handle_directory_list(
         return f"Error: {e}"
 
 
-async def determine_path_type(
+async def read_path(
     ssh_host: "SSHHost",
     path: str,
-) -> tuple[str | None, str | None]:
-    """Determine if path is a file or directory.
+) -> tuple[str | None, str, str | None]:
+    """Determine a path's type and, for files, read it in one round-trip.
 
     Args:
         ssh_host: SSH host configuration
-        path: Path to check
+        path: Path to read
 
     Returns:
-        Tuple of (path_type, error_message)
+        Tuple of (path_type, contents, error_message)
         path_type is 'file', 'directory', or None
-        error_message is set if an error occurred
+        contents is the file contents (or a read error message) for files,
+        empty otherwise
+        error_message is set if the path could not be stat'ed
     """
+    config = get_config()
+
     conn, error = await _get_connection(ssh_host)
     if error:
-        return None, error
+        return None, "", error
 
     assert conn is not None  # For mypy - error check above ensures this
 
     try:
-        path_type = await stat_path(conn, path)
-        if path_type is None:
-            return None, f"Path not found: {path}"
-        return path_type, None
+        path_type, contents, was_truncated = await stat_and_cat(
+            conn, path, config.max_file_size
+        )
+    except RuntimeError as e:
+        # The path exists but could not be read
+        return "file", f"Error: {e}", None
     except Exception as e:
-        return None, f"Cannot stat {path}: {e}"
+        return None, "", f"Cannot stat {path}: {e}"
+
+    if path_type is None:
+        return None, "", f"Path not found: {path}"
+    if was_truncated:
+        contents += f"\n\n[truncated at {config.max_file_size} bytes]"
+    return path_type, contents, None
 
 
 async def handle_beam_transfer(
@@ -18,11 +18,10 @@ from scout_mcp.services import (
     get_pool,
 )
 from scout_mcp.tools.handlers import (
-    determine_path_type,
     handle_command_execution,
     handle_directory_list,
-    handle_file_read,
     handle_hosts_list,
+    read_path,
 )
 from scout_mcp.ui import create_directory_ui, create_file_viewer_ui
 from scout_mcp.utils.parser import parse_target
@@ -272,15 +271,13 @@ async def scout(
     if query:
         return await handle_command_execution(ssh_host, parsed.path, query)
 
-    # Determine if path is file or directory
-    path_type, error = await determine_path_type(ssh_host, parsed.path)
+    # Determine if path is file or directory (files are read in the same call)
+    path_type, content, error = await read_path(ssh_host, parsed.path)
     if error:
         return f"Error: {error}"
 
     # Handle file or directory
     if path_type == "file":
-        content = await handle_file_read(ssh_host, parsed.path)
-
         # Return plain text if UI is disabled
         if not config.enable_ui:
             return content
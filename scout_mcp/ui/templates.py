@@ -1,8 +1,34 @@
 # ruff: noqa: E501
 """HTML templates for UI resources."""
 
+import os
 import re
 
+# Single C-level pass equivalent to html.escape(s, quote=True)
+_HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+# Minification costs CPU on every render and saves little once the HTTP
+# transport compresses responses, so it is opt-in via SCOUT_MINIFY_HTML
+_MINIFY_ENABLED = os.getenv("SCOUT_MINIFY_HTML", "").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+
+# Sequences that could terminate a raw-text <script> block early. Any run of
+# backslashes after "<" is matched too, and one more is added, so the
+# viewer's unescape (drop one backslash) restores every input exactly,
+# including text that already contains "<\/script"
+_SCRIPT_BREAKOUT_RE = re.compile(r"<(\\*)(/script|!--)", re.IGNORECASE)
+
+# Placeholder slots in the pre-built markdown viewer shell
+_HOST_SLOT = "__SCOUT_HOST__"
+_PATH_SLOT = "__SCOUT_PATH__"
+_CONTENT_SLOT = "__SCOUT_CONTENT__"
+
 
 def minify_html(html: str) -> str:
     """Minify HTML by removing unnecessary whitespace.
@@ -22,8 +48,12 @@ def minify_html(html: str) -> str:
         html: HTML string to minify
 
     Returns:
-        Minified HTML string (typically 30-40% smaller)
+        Minified HTML string (typically 30-40% smaller), or the input
+        unchanged when SCOUT_MINIFY_HTML is not enabled
     """
+    if not _MINIFY_ENABLED:
+        return html
+
     # Remove HTML comments (but preserve IE conditional comments)
     html = re.sub(r'<!--(?!\[if\s).*?-->', '', html, flags=re.DOTALL)
 
@@ -469,8 +499,7 @@ def get_file_viewer_html(
         Complete HTML page with file viewer
     """
     # Escape HTML in content
-    import html
-    escaped_content = html.escape(content)
+    escaped_content = content.translate(_HTML_ESCAPE_TABLE)
 
     # Get file extension for syntax highlighting hint
     extension = path.rsplit(".", 1)[-1] if "." in path else ""
@@ -630,8 +659,6 @@ def get_log_viewer_html(host: str, path: str, content: str) -> str:
     Returns:
         Complete HTML page with log viewer
     """
-    import html
-
     # Parse log lines
     lines = content.split("\n")
     log_lines_html = []
@@ -649,7 +676,7 @@ def get_log_viewer_html(host: str, path: str, content: str) -> str:
         elif "DEBUG" in line:
             level = "DEBUG"
 
-        escaped_line = html.escape(line)
+        escaped_line = line.translate(_HTML_ESCAPE_TABLE)
 
         log_lines_html.append(
             f'<div class="log-line log-{level.lower()}" data-level="{level}" '
@@ -815,6 +842,9 @@ def get_log_viewer_html(host: str, path: str, content: str) -> str:
 def get_markdown_viewer_html(host: str, path: str, content: str) -> str:
     """Generate markdown viewer HTML with rendered preview.
 
+    Fills the pre-minified shell; the document itself never goes through
+    minify_html, so its whitespace is preserved.
+
     Args:
         host: SSH hostname
         path: Markdown file path
@@ -823,8 +853,22 @@ def get_markdown_viewer_html(host: str, path: str, content: str) -> str:
     Returns:
         Complete HTML page with markdown viewer
     """
-    import html
-    escaped_content = html.escape(content)
+    # Embedded as raw text in a non-executed <script> block, so only
+    # sequences that would close the block need escaping
+    values = {
+        _HOST_SLOT: host,
+        _PATH_SLOT: path,
+        _CONTENT_SLOT: _SCRIPT_BREAKOUT_RE.sub(r"<\\\1\2", content),
+    }
+    parts = _MARKDOWN_VIEWER_PARTS
+    return "".join(values[part] if i % 2 else part for i, part in enumerate(parts))
+
+
+def _build_markdown_viewer_shell() -> str:
+    """Build the minified markdown viewer page with placeholder slots."""
+    host = _HOST_SLOT
+    path = _PATH_SLOT
+    script_safe_content = _CONTENT_SLOT
 
     html_content = f"""
     <!DOCTYPE html>
@@ -949,14 +993,18 @@ def get_markdown_viewer_html(host: str, path: str, content: str) -> str:
             </div>
 
             <div id="renderedView" class="markdown-rendered"></div>
-            <div id="rawView" class="markdown-raw hidden">{escaped_content}</div>
+            <div id="rawView" class="markdown-raw hidden"></div>
         </div>
 
+        <script id="markdownSource" type="text/markdown">{script_safe_content}</script>
+
         <script>
-            const markdownContent = `{escaped_content}`;
+            const markdownContent = document.getElementById('markdownSource')
+                .textContent.replace(/<\\\\(\\\\*)(\\/script|!--)/gi, '<$1$2');
 
             // Render markdown
             document.getElementById('renderedView').innerHTML = marked.parse(markdownContent);
+            document.getElementById('rawView').textContent = markdownContent;
 
             function showView(view) {{
                 const renderedView = document.getElementById('renderedView');
@@ -982,3 +1030,10 @@ def get_markdown_viewer_html(host: str, path: str, content: str) -> str:
     """
 
     return minify_html(html_content)
+
+
+# Static markdown viewer markup is minified once at import; the dynamic
+# values are spliced between these parts (odd indices are slot names)
+_MARKDOWN_VIEWER_PARTS = re.split(
+    f"({_HOST_SLOT}|{_PATH_SLOT}|{_CONTENT_SLOT})", _build_markdown_viewer_shell()
+)
@@ -1,16 +1,41 @@
-"""Utilities for Scout MCP."""
-
-from scout_mcp.utils.console import ColorfulFormatter, MCPRequestFormatter
-from scout_mcp.utils.hostname import get_server_hostname, is_localhost_target
-from scout_mcp.utils.mime import get_mime_type
-from scout_mcp.utils.parser import parse_target
-from scout_mcp.utils.ping import check_host_online, check_hosts_online
-from scout_mcp.utils.shell import quote_arg, quote_path
-from scout_mcp.utils.validation import (
-    PathTraversalError,
-    validate_host_format,
-    validate_path,
-)
+"""Utilities for Scout MCP.
+
+Re-exports are resolved lazily (PEP 562) so importing one helper, such as
+``parse_target``, does not pull in every utility module and its
+dependencies (``zoneinfo``, ``socket``, ``shlex``, ...).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from scout_mcp.utils.console import ColorfulFormatter, MCPRequestFormatter
+    from scout_mcp.utils.hostname import get_server_hostname, is_localhost_target
+    from scout_mcp.utils.mime import get_mime_type
+    from scout_mcp.utils.parser import parse_target
+    from scout_mcp.utils.ping import check_host_online, check_hosts_online
+    from scout_mcp.utils.shell import quote_arg, quote_path
+    from scout_mcp.utils.validation import (
+        PathTraversalError,
+        validate_host_format,
+        validate_path,
+    )
+
+_EXPORTS: dict[str, str] = {
+    "check_host_online": "scout_mcp.utils.ping",
+    "check_hosts_online": "scout_mcp.utils.ping",
+    "ColorfulFormatter": "scout_mcp.utils.console",
+    "get_mime_type": "scout_mcp.utils.mime",
+    "get_server_hostname": "scout_mcp.utils.hostname",
+    "is_localhost_target": "scout_mcp.utils.hostname",
+    "MCPRequestFormatter": "scout_mcp.utils.console",
+    "parse_target": "scout_mcp.utils.parser",
+    "PathTraversalError": "scout_mcp.utils.validation",
+    "quote_arg": "scout_mcp.utils.shell",
+    "quote_path": "scout_mcp.utils.shell",
+    "validate_host_format": "scout_mcp.utils.validation",
+    "validate_path": "scout_mcp.utils.validation",
+}
 
 __all__ = [
     "check_host_online",
@@ -27,3 +52,17 @@ __all__ = [
     "validate_host_format",
     "validate_path",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported utility from its submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,6 +1,7 @@
 """Colorful console logging formatter with EST timestamps."""
 
 import logging
+import re
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
@@ -56,6 +57,46 @@ COMPONENT_COLORS = {
 
 EST = ZoneInfo("America/New_York")
 
+# Message highlighters: (compiled pattern, replacement) applied in order
+_HIGHLIGHT_RULES = tuple(
+    (re.compile(pattern), f"{color}\\1{COLORS['reset']}")
+    for pattern, color in (
+        # Resource URIs like tootie://path or scout://host/path
+        (r"(\w+://[^\s]+)", COLORS["bright_blue"]),
+        # Durations like "123.45ms" or "1000ms"
+        (r"(\d+\.?\d*ms)", COLORS["bright_yellow"]),
+        # SSH connection info like user@host:port
+        (r"(\w+@[\w\.\-]+:\d+)", COLORS["bright_magenta"]),
+        # Pool sizes
+        (r"(pool_size=\d+)", COLORS["cyan"]),
+    )
+)
+_TOOL_SCOUT_HIGHLIGHT = f"{COLORS['bright_cyan']}tool:scout{COLORS['reset']}"
+
+# MCPRequestFormatter event indicators: (keywords, prefix) in priority order
+_EVENT_INDICATORS: tuple[tuple[tuple[str, ...], str], ...] = (
+    (("starting", "ready"), f"{COLORS['bright_green']}>>>{COLORS['reset']} "),
+    (("shutting down", "shutdown"), f"{COLORS['bright_red']}<<<{COLORS['reset']} "),
+    (("error", "failed"), f"{COLORS['bright_red']}!!{COLORS['reset']}  "),
+    (("warning", "slow"), f"{COLORS['bright_yellow']}!{COLORS['reset']}   "),
+    (("completed", "succeeded"), f"{COLORS['bright_green']}OK{COLORS['reset']}  "),
+    (("opening", "creating"), f"{COLORS['bright_cyan']}+{COLORS['reset']}   "),
+    (("closing", "removing"), f"{COLORS['bright_yellow']}-{COLORS['reset']}   "),
+    (("reusing",), f"{COLORS['bright_magenta']}~{COLORS['reset']}   "),
+)
+_EVENT_PRIORITY: dict[str, int] = {
+    keyword: index
+    for index, (keywords, _) in enumerate(_EVENT_INDICATORS)
+    for keyword in keywords
+}
+# Lookahead so overlapping keywords are all found in a single scan
+_EVENT_RE = re.compile(
+    "(?=({}))".format("|".join(re.escape(k) for k in _EVENT_PRIORITY))
+)
+
+# Logger name -> (display name, color); logger names are a small bounded set
+_COMPONENT_CACHE: dict[str, tuple[str, str]] = {}
+
 
 class ColorfulFormatter(logging.Formatter):
     """Colorful log formatter with EST timestamps and component highlighting."""
@@ -68,6 +109,14 @@ class ColorfulFormatter(logging.Formatter):
         """
         super().__init__()
         self.use_colors = use_colors
+        # (UTC epoch hour, local "HH", local "MM/DD") of the last record
+        self._ts_cache: tuple[int, str, str] = (-1, "", "")
+        # Fully rendered (colored, padded) level and component columns
+        self._level_cache: dict[str, str] = {}
+        self._component_render_cache: dict[str, str] = {}
+        self._dim = COLORS["dim"] if use_colors else ""
+        self._reset = COLORS["reset"] if use_colors else ""
+        self._sep = self._colorize("|", COLORS["dim"])
 
     def _colorize(self, text: str, color: str) -> str:
         """Apply color to text if colors are enabled."""
@@ -77,118 +126,91 @@ class ColorfulFormatter(logging.Formatter):
 
     def _get_component_color(self, name: str) -> str:
         """Get color for a logger name/component."""
-        for prefix, color in COMPONENT_COLORS.items():
-            if prefix != "default" and name.startswith(prefix):
-                return color
-        return COMPONENT_COLORS["default"]
+        return self._get_component(name)[1]
+
+    @staticmethod
+    def _get_component(name: str) -> tuple[str, str]:
+        """Get display name and color for a logger name, cached per name."""
+        cached = _COMPONENT_CACHE.get(name)
+        if cached is not None:
+            return cached
+
+        color = next(
+            (
+                color
+                for prefix, color in COMPONENT_COLORS.items()
+                if prefix != "default" and name.startswith(prefix)
+            ),
+            COMPONENT_COLORS["default"],
+        )
+        # Shorten common prefixes
+        display = name[10:] if name.startswith("scout_mcp.") else name
+        _COMPONENT_CACHE[name] = (display, color)
+        return display, color
 
     def _format_timestamp(self, record: logging.LogRecord) -> str:
-        """Format timestamp in EST with nice formatting."""
-        dt = datetime.fromtimestamp(record.created, tz=EST)
-        time_str = dt.strftime("%H:%M:%S")
-        date_str = dt.strftime("%m/%d")
-        ms_str = f".{int(record.msecs):03d}"
-        return f"{time_str}{ms_str} {date_str}"
+        """Format timestamp in EST with nice formatting.
+
+        EST's UTC offset is always a whole number of hours (DST included),
+        so local minutes and seconds equal UTC ones. The zone conversion
+        only runs when a record lands in a new UTC hour.
+        """
+        second = int(record.created)
+        hour, rem = divmod(second, 3600)
+        cached_hour, hour_str, date_str = self._ts_cache
+        if hour != cached_hour:
+            dt = datetime.fromtimestamp(hour * 3600, tz=EST)
+            hour_str = f"{dt.hour:02d}"
+            date_str = f"{dt.month:02d}/{dt.day:02d}"
+            self._ts_cache = (hour, hour_str, date_str)
+        minute, sec = divmod(rem, 60)
+        return f"{hour_str}:{minute:02d}:{sec:02d}.{int(record.msecs):03d} {date_str}"
 
     def _format_level(self, record: logging.LogRecord) -> str:
         """Format log level with color and fixed width."""
         level = record.levelname
-        color = LEVEL_COLORS.get(level, COLORS["white"])
-        padded = f"{level:<8}"
-        return self._colorize(padded, color)
+        rendered = self._level_cache.get(level)
+        if rendered is None:
+            color = LEVEL_COLORS.get(level, COLORS["white"])
+            rendered = self._colorize(f"{level:<8}", color)
+            self._level_cache[level] = rendered
+        return rendered
 
     def _format_component(self, record: logging.LogRecord) -> str:
         """Format component/logger name with color."""
-        name = record.name
-        # Shorten common prefixes
-        if name.startswith("scout_mcp."):
-            name = name[10:]  # Remove "scout_mcp." prefix
-        color = self._get_component_color(record.name)
-        return self._colorize(f"{name:<20}", color)
+        rendered = self._component_render_cache.get(record.name)
+        if rendered is None:
+            name, color = self._get_component(record.name)
+            rendered = self._colorize(f"{name:<20}", color)
+            self._component_render_cache[record.name] = rendered
+        return rendered
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record with colors and EST timestamp."""
-        # Timestamp (dim)
-        timestamp = self._format_timestamp(record)
-        timestamp = self._colorize(timestamp, COLORS["dim"])
-
-        # Level (colored by severity)
-        level = self._format_level(record)
-
-        # Component/logger name (colored by type)
-        component = self._format_component(record)
-
-        # Separator
-        sep = self._colorize("|", COLORS["dim"])
-
-        # Message
-        message = record.getMessage()
-
-        # Highlight specific patterns in messages
+        # Message (stored on the record like logging.Formatter does, so
+        # subclasses don't re-apply the % args), with patterns highlighted
+        message = record.message = record.getMessage()
         message = self._highlight_message(message)
 
-        # Format final line
-        return f"{timestamp} {sep} {level} {sep} {component} {sep} {message}"
+        # Dim timestamp, then level and component columns colored by
+        # severity/type; both columns are rendered once and cached
+        sep = self._sep
+        return (
+            f"{self._dim}{self._format_timestamp(record)}{self._reset} {sep} "
+            f"{self._format_level(record)} {sep} "
+            f"{self._format_component(record)} {sep} {message}"
+        )
 
     def _highlight_message(self, message: str) -> str:
         """Highlight specific patterns in log messages."""
         if not self.use_colors:
             return message
 
-        # Highlight tool names
-        if "tool:" in message.lower() or "scout" in message.lower():
-            # Highlight "scout" when it appears as a tool name
-            message = message.replace(
-                "tool:scout",
-                f"{COLORS['bright_cyan']}tool:scout{COLORS['reset']}",
-            )
-
-        # Highlight resource URIs
-        if "://" in message:
-            import re
-
-            # Match URIs like tootie://path or scout://host/path
-            uri_pattern = r"(\w+://[^\s]+)"
-            message = re.sub(
-                uri_pattern,
-                f"{COLORS['bright_blue']}\\1{COLORS['reset']}",
-                message,
-            )
-
-        # Highlight durations
-        if "ms" in message:
-            import re
-
-            # Match patterns like "123.45ms" or "1000ms"
-            ms_pattern = r"(\d+\.?\d*ms)"
-            message = re.sub(
-                ms_pattern,
-                f"{COLORS['bright_yellow']}\\1{COLORS['reset']}",
-                message,
-            )
-
-        # Highlight SSH connection info
-        if "@" in message and ":" in message:
-            import re
-
-            # Match user@host:port patterns
-            ssh_pattern = r"(\w+@[\w\.\-]+:\d+)"
-            message = re.sub(
-                ssh_pattern,
-                f"{COLORS['bright_magenta']}\\1{COLORS['reset']}",
-                message,
-            )
-
-        # Highlight host names in parentheses
-        if "pool_size=" in message:
-            import re
-
-            pool_pattern = r"(pool_size=\d+)"
-            message = re.sub(
-                pool_pattern,
-                f"{COLORS['cyan']}\\1{COLORS['reset']}",
-                message,
-            )
+        # Highlight "scout" when it appears as a tool name
+        message = message.replace("tool:scout", _TOOL_SCOUT_HIGHLIGHT)
+
+        for pattern, replacement in _HIGHLIGHT_RULES:
+            message = pattern.sub(replacement, message)
 
         return message
 
@@ -201,28 +223,14 @@ class MCPRequestFormatter(ColorfulFormatter):
         # Get base format
         base = super().format(record)
 
-        # Add extra visual indicators for specific events
-        message = record.getMessage().lower()
-
         if not self.use_colors:
             return base
 
-        # Add emoji-style indicators
-        if "starting" in message or "ready" in message:
-            return f"{COLORS['bright_green']}>>>{COLORS['reset']} {base}"
-        elif "shutting down" in message or "shutdown" in message:
-            return f"{COLORS['bright_red']}<<<{COLORS['reset']} {base}"
-        elif "error" in message or "failed" in message:
-            return f"{COLORS['bright_red']}!!{COLORS['reset']}  {base}"
-        elif "warning" in message or "slow" in message:
-            return f"{COLORS['bright_yellow']}!{COLORS['reset']}   {base}"
-        elif "completed" in message or "succeeded" in message:
-            return f"{COLORS['bright_green']}OK{COLORS['reset']}  {base}"
-        elif "opening" in message or "creating" in message:
-            return f"{COLORS['bright_cyan']}+{COLORS['reset']}   {base}"
-        elif "closing" in message or "removing" in message:
-            return f"{COLORS['bright_yellow']}-{COLORS['reset']}   {base}"
-        elif "reusing" in message:
-            return f"{COLORS['bright_magenta']}~{COLORS['reset']}   {base}"
+        # Add emoji-style indicators for specific events; the earliest
+        # category in _EVENT_INDICATORS wins when several keywords appear
+        matches = _EVENT_RE.findall(record.message.lower())
+        if matches:
+            priority = min(_EVENT_PRIORITY[match] for match in matches)
+            return _EVENT_INDICATORS[priority][1] + base
 
         return f"    {base}"
@@ -1,11 +1,16 @@
 """Hostname detection utilities for localhost identification."""
 
+import functools
 import socket
 
 
+@functools.cache
 def get_server_hostname() -> str:
     """Get the hostname of the machine running Scout MCP.
 
+    Cached for the process lifetime so localhost checks don't issue a
+    gethostname() syscall per call.
+
     <returns>
     Hostname string (lowercase for consistent comparison)
     </returns>
@@ -28,22 +33,13 @@ def is_localhost_target(target_host: str) -> bool:
         return False
 
     server_hostname = get_server_hostname()
+    server_short = server_hostname.partition(".")[0]
     target_lower = target_host.lower()
 
-    # Direct match
-    if target_lower == server_hostname:
+    # Direct match, or target is the short form of the server's FQDN
+    if target_lower in (server_hostname, server_short):
         return True
 
-    # Check if server hostname is FQDN and target is short name
-    if "." in server_hostname:
-        short_name = server_hostname.split(".")[0]
-        if target_lower == short_name:
-            return True
-
     # Check if target is FQDN and server is short name
-    if "." in target_lower:
-        target_short = target_lower.split(".")[0]
-        if target_short == server_hostname:
-            return True
-
-    return False
+    target_short, dot, _ = target_lower.partition(".")
+    return bool(dot) and target_short == server_hostname
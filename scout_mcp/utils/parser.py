@@ -1,9 +1,12 @@
 """Scout target URI parsing."""
 
+from functools import lru_cache
+
 from scout_mcp.models import ScoutTarget
 from scout_mcp.utils.validation import validate_host_format, validate_path
 
 
+@lru_cache(maxsize=1024)
 def parse_target(target: str) -> ScoutTarget:
     """Parse a scout target URI.
 
@@ -11,6 +14,10 @@ def parse_target(target: str) -> ScoutTarget:
         - "hosts" -> list available hosts
         - "hostname:/path" -> target a specific path on host
 
+    Parsing is pure, so results are memoized; repeated targets (polling
+    the same log, broadcast batches) skip validation entirely. Invalid
+    targets raise and are not cached.
+
     Returns:
         ScoutTarget with parsed components.
 
@@ -24,14 +31,13 @@ def parse_target(target: str) -> ScoutTarget:
     if target.lower() == "hosts":
         return ScoutTarget(host=None, is_hosts_command=True)
 
-    # Parse host:/path format
-    if ":" not in target:
+    # Parse host:/path format, splitting on first colon only (path may
+    # contain colons)
+    host, sep, path = target.partition(":")
+    if not sep:
         raise ValueError(f"Invalid target '{target}'. Expected 'host:/path' or 'hosts'")
-
-    # Split on first colon only (path may contain colons)
-    parts = target.split(":", 1)
-    host = parts[0].strip()
-    path = parts[1].strip() if len(parts) > 1 else ""
+    host = host.strip()
+    path = path.strip()
 
     # Validate host
     host = validate_host_format(host)
@@ -1,11 +1,20 @@
 """Host connectivity checking utilities."""
 
 import asyncio
+import socket
+
+# Cap on simultaneous probes so large host lists don't exhaust file descriptors
+MAX_CONCURRENT_CHECKS = 64
 
 
 async def check_host_online(hostname: str, port: int, timeout: float = 2.0) -> bool:
     """Check if a host is reachable via TCP connection.
 
+    Connects a bare non-blocking socket rather than opening asyncio streams,
+    since only the TCP handshake matters and the socket is closed right away.
+    Like asyncio.open_connection, every resolved address is tried in order,
+    so a dual-stack name whose IPv6 address refuses still reaches IPv4.
+
     Args:
         hostname: Host to check.
         port: Port to connect to (usually SSH port).
@@ -14,27 +23,34 @@ async def check_host_online(hostname: str, port: int, timeout: float = 2.0) -> b
     Returns:
         True if host is reachable, False otherwise.
     """
+    loop = asyncio.get_running_loop()
     try:
-        _, writer = await asyncio.wait_for(
-            asyncio.open_connection(hostname, port),
-            timeout=timeout,
-        )
-        writer.close()
-        await writer.wait_closed()
-        return True
+        async with asyncio.timeout(timeout):
+            addr_info = await loop.getaddrinfo(hostname, port, type=socket.SOCK_STREAM)
+            for family, sock_type, proto, _, address in addr_info:
+                try:
+                    with socket.socket(family, sock_type, proto) as sock:
+                        sock.setblocking(False)
+                        await loop.sock_connect(sock, address)
+                except OSError:
+                    continue
+                return True
     except (TimeoutError, OSError):
-        return False
+        pass
+    return False
 
 
 async def check_hosts_online(
     hosts: dict[str, tuple[str, int]],
     timeout: float = 2.0,
+    max_concurrency: int = MAX_CONCURRENT_CHECKS,
 ) -> dict[str, bool]:
     """Check multiple hosts concurrently.
 
     Args:
         hosts: Dict of {name: (hostname, port)}.
         timeout: Connection timeout per host.
+        max_concurrency: Maximum number of checks in flight at once.
 
     Returns:
         Dict of {name: is_online}.
@@ -42,10 +58,15 @@ async def check_hosts_online(
     if not hosts:
         return {}
 
-    names = list(hosts.keys())
-    coros = [
-        check_host_online(hostname, port, timeout) for hostname, port in hosts.values()
-    ]
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded_check(hostname: str, port: int) -> bool:
+        async with semaphore:
+            return await check_host_online(hostname, port, timeout)
 
-    results = await asyncio.gather(*coros)
-    return dict(zip(names, results, strict=True))
+    # gather preserves argument order, and hosts is not mutated while awaiting,
+    # so iterating the dict again lines results up with their names.
+    results = await asyncio.gather(
+        *(bounded_check(hostname, port) for hostname, port in hosts.values())
+    )
+    return dict(zip(hosts, results, strict=True))
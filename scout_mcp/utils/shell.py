@@ -1,18 +1,23 @@
 """Shell command safety utilities."""
 
+import functools
 import shlex
 
+# Bounded cache over shlex.quote: the executors quote the same paths,
+# containers and arguments on every request, so repeats become a dict hit
+_quote = functools.lru_cache(maxsize=512)(shlex.quote)
+
 
 def quote_path(path: str) -> str:
-    """Safely quote a path for shell commands.
+    """Safely quote a file system path for shell commands.
 
     Args:
-        path: File system path to quote
+        path: Remote path to quote
 
     Returns:
-        Shell-safe quoted path
+        Shell-safe single token
     """
-    return shlex.quote(path)
+    return _quote(path)
 
 
 def quote_arg(arg: str) -> str:
@@ -22,6 +27,6 @@ def quote_arg(arg: str) -> str:
         arg: Argument to quote
 
     Returns:
-        Shell-safe quoted argument
+        Shell-safe single token
     """
-    return shlex.quote(arg)
+    return _quote(arg)
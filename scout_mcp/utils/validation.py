@@ -1,7 +1,6 @@
 """Path and input validation utilities."""
 
 import os
-import re
 from typing import Final
 
 
@@ -11,13 +10,34 @@ class PathTraversalError(ValueError):
     pass
 
 
-# Path traversal patterns to reject
-TRAVERSAL_PATTERNS: Final[list[str]] = [
-    r"\.\./",  # ../
-    r"/\.\.",  # /..
-    r"^\.\.$",  # Just ..
-    r"^\.\./",  # Starts with ../
-]
+# Host characters that could enable shell injection
+_SUSPICIOUS_HOST_CHARS: Final[frozenset[str]] = frozenset(
+    ["/", "\\", ";", "&", "|", "$", "`", "\n", "\r", "\x00"]
+)
+
+
+def _has_traversal(path: str) -> bool:
+    """Check path for "../", "/.." or a bare ".." using substring scans.
+
+    Plain substring checks avoid regex dispatch, which has no literal
+    prefix to skip ahead on and dominates long paths.
+    """
+    return "../" in path or "/.." in path or path == ".."
+
+
+def _needs_normpath(path: str) -> bool:
+    """Check whether os.path.normpath would rewrite a traversal-free path.
+
+    True for repeated slashes, "." components, or a trailing slash.
+    """
+    return (
+        "//" in path
+        or "/./" in path
+        or path.startswith("./")
+        or path.endswith("/.")
+        or path == "."
+        or (len(path) > 1 and path.endswith("/"))
+    )
 
 
 def validate_path(path: str, allow_absolute: bool = True) -> str:
@@ -44,22 +64,24 @@ def validate_path(path: str, allow_absolute: bool = True) -> str:
         raise PathTraversalError(f"Path contains null byte: {path!r}")
 
     # Check for explicit traversal sequences before normalization
-    for pattern in TRAVERSAL_PATTERNS:
-        if re.search(pattern, path):
-            raise PathTraversalError(f"Path traversal not allowed: {path}")
-
-    # Normalize the path
-    try:
-        normalized = os.path.normpath(path)
-    except (ValueError, TypeError) as e:
-        raise ValueError(f"Invalid path: {path}") from e
+    if _has_traversal(path):
+        raise PathTraversalError(f"Path traversal not allowed: {path}")
+
+    # Normalize the path (most real paths are already canonical)
+    if not _needs_normpath(path):
+        normalized = path
+    else:
+        try:
+            normalized = os.path.normpath(path)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid path: {path}") from e
 
     # After normalization, check if we escaped the root
     if normalized.startswith(".."):
         raise PathTraversalError(f"Path escapes root after normalization: {path}")
 
     # Check absolute path policy
-    if not allow_absolute and os.path.isabs(normalized):
+    if not allow_absolute and normalized.startswith("/"):
         raise ValueError(f"Absolute paths not allowed: {path}")
 
     # Allow ~ paths as-is for remote expansion
@@ -89,10 +111,8 @@ def validate_host_format(host: str) -> str:
         raise ValueError(f"Host name too long: {len(host)} chars")
 
     # Check for suspicious characters that could enable injection
-    suspicious_chars = ["/", "\\", ";", "&", "|", "$", "`", "\n", "\r", "\x00"]
-    for char in suspicious_chars:
-        if char in host:
-            raise ValueError(f"Host contains invalid characters: {host!r}")
+    if not _SUSPICIOUS_HOST_CHARS.isdisjoint(host):
+        raise ValueError(f"Host contains invalid characters: {host!r}")
 
     return host
 
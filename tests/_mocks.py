@@ -0,0 +1,35 @@
+"""Mock SSH connections shared across the test suite."""
+
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+MockSSHFactory = Callable[..., tuple[AsyncMock, AsyncMock]]
+
+
+def make_mock_ssh(
+    get_side_effect: Any = None,
+    put_side_effect: Any = None,
+) -> tuple[AsyncMock, AsyncMock]:
+    """Build a mock SSH connection wired to a mock SFTP client.
+
+    Args:
+        get_side_effect: Side effect for ``sftp.get``
+        put_side_effect: Side effect for ``sftp.put``
+
+    Returns:
+        Tuple of (mock_conn, mock_sftp)
+    """
+    mock_sftp = AsyncMock()
+    mock_sftp.get.side_effect = get_side_effect
+    mock_sftp.put.side_effect = put_side_effect
+
+    # start_sftp_client() returns an async context manager yielding sftp
+    mock_sftp_ctx = AsyncMock()
+    mock_sftp_ctx.__aenter__.return_value = mock_sftp
+    mock_sftp_ctx.__aexit__.return_value = None
+
+    mock_conn = AsyncMock()
+    mock_conn.is_closed = False
+    mock_conn.start_sftp_client = MagicMock(return_value=mock_sftp_ctx)
+    return mock_conn, mock_sftp
@@ -0,0 +1,49 @@
+"""Mock SSH connection shared by the executor and end-to-end benchmarks."""
+
+import asyncio
+
+
+class MockSSHResult:
+    """Mock SSH command result."""
+
+    def __init__(self, returncode: int, stdout: str, stderr: str = "") -> None:
+        """Initialize mock result."""
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+
+
+# Canned results keyed by the command's first shell token, as the executors
+# build them: stat_path -> "stat", cat_file -> "head", ls_dir -> "ls",
+# run_command -> "cd", stat_and_cat -> "t=$(stat". Shared so the benchmarks
+# measure executor and pool work rather than building mock output per call.
+_RESULTS: dict[str, MockSSHResult] = {
+    "stat": MockSSHResult(0, "regular file"),
+    "t=$(stat": MockSSHResult(0, "regular file\n" + "file contents\n" * 100),
+    "head": MockSSHResult(0, "file contents\n" * 100),
+    "ls": MockSSHResult(0, "-rw-r--r-- 1 user group 1234 Jan 1 file.txt\n" * 50),
+    "cd": MockSSHResult(0, "command output"),
+}
+_DEFAULT_RESULT = MockSSHResult(0, "output")
+
+
+class MockSSHConnection:
+    """Mock SSH connection with a fixed per-command latency."""
+
+    __slots__ = ("_latency", "_command_count", "is_closed")
+
+    def __init__(self, latency: float = 0.001) -> None:
+        """Initialize mock connection."""
+        self._latency = latency
+        self._command_count = 0
+        self.is_closed = False
+
+    async def run(self, command: str, check: bool = True) -> MockSSHResult:
+        """Mock command execution."""
+        self._command_count += 1
+        await asyncio.sleep(self._latency)
+        return _RESULTS.get(command.partition(" ")[0], _DEFAULT_RESULT)
+
+    def close(self) -> None:
+        """Close connection."""
+        self.is_closed = True
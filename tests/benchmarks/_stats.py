@@ -0,0 +1,21 @@
+"""Latency statistics shared by the benchmarks."""
+
+from collections.abc import Iterable
+
+
+def percentiles(samples: Iterable[float], *fractions: float) -> list[float]:
+    """Nearest-rank percentiles of a sample, sorting it once.
+
+    Used instead of statistics.quantiles(), which re-sorts and interpolates
+    a full n-way split for every percentile reported.
+
+    Args:
+        samples: Measured values (any order)
+        fractions: Percentiles to report, as fractions (0.95 for P95)
+
+    Returns:
+        One value per requested fraction, in the same order
+    """
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+    return [ordered[min(last, int(len(ordered) * f))] for f in fractions]
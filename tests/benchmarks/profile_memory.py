@@ -3,25 +3,42 @@
 import asyncio
 import tracemalloc
 
-from scout_mcp.pool import ConnectionPool
-
 from scout_mcp.models import SSHHost
+from scout_mcp.services.pool import ConnectionPool
+
+# Number of frames recorded per allocation, so the scout_mcp filter can see
+# allocations made on its behalf deeper in the stack
+TRACEBACK_FRAMES = 10
+
+# Keep scout_mcp allocations; drop asyncio and tracemalloc's own bookkeeping
+SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(True, "*/scout_mcp/*", all_frames=True),
+    tracemalloc.Filter(False, "*/asyncio/*"),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+]
+
+
+# Immutable mock output shared by every run() call
+_RESULT = type(
+    "Result", (), {"returncode": 0, "stdout": "output" * 100, "stderr": ""}
+)()
 
 
 class MockSSHConnection:
     """Mock SSH connection."""
 
+    # Shared, immutable 1KB buffer: per-instance copies would show up in the
+    # tracemalloc diffs as allocations the pool never makes
+    _buffer = b"x" * 1024
+
     def __init__(self) -> None:
         """Initialize mock connection."""
         self.is_closed = False
-        self._buffer = b"x" * 1024  # 1KB buffer
 
     async def run(self, command: str, check: bool = True) -> object:
         """Mock command execution."""
         await asyncio.sleep(0.001)
-        return type(
-            "Result", (), {"returncode": 0, "stdout": "output" * 100, "stderr": ""}
-        )()
+        return _RESULT
 
     def close(self) -> None:
         """Close connection."""
@@ -34,21 +51,26 @@ async def mock_connect(*args, **kwargs) -> MockSSHConnection:  # type: ignore[no
     return MockSSHConnection()
 
 
+def take_snapshot() -> tracemalloc.Snapshot:
+    """Take a snapshot restricted to scout_mcp allocations."""
+    return tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+
+
 async def profile_memory() -> None:
     """Profile memory usage."""
     # Monkey patch asyncssh
-    import mcp_cat.pool
+    import scout_mcp.services.pool
 
-    mcp_cat.pool.asyncssh = type("", (), {"connect": mock_connect})()  # type: ignore[attr-defined]
+    scout_mcp.services.pool.asyncssh = type("", (), {"connect": mock_connect})()  # type: ignore[assignment]
 
-    tracemalloc.start()
+    tracemalloc.start(TRACEBACK_FRAMES)
 
     # Baseline
-    snapshot1 = tracemalloc.take_snapshot()
+    snapshot1 = take_snapshot()
 
     # Create pool
     pool = ConnectionPool()
-    snapshot2 = tracemalloc.take_snapshot()
+    snapshot2 = take_snapshot()
 
     # Create 100 connections
     hosts = [
@@ -61,16 +83,16 @@ async def profile_memory() -> None:
         for i in range(100)
     ]
 
-    for host in hosts:
-        await pool.get_connection(host)
+    # Dial concurrently, as production callers do
+    await asyncio.gather(*(pool.get_connection(host) for host in hosts))
 
-    snapshot3 = tracemalloc.take_snapshot()
+    snapshot3 = take_snapshot()
 
     # Reuse connections 1000 times
     for _ in range(1000):
         await pool.get_connection(hosts[0])
 
-    snapshot4 = tracemalloc.take_snapshot()
+    snapshot4 = take_snapshot()
 
     # Analyze differences
     print("\n" + "=" * 80)
@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 from scout_mcp.config import Config, SSHConfigParser, HostKeyVerifier, Settings
+from tests.benchmarks._stats import percentiles
 
 
 def create_bench_config(
@@ -101,12 +102,12 @@ def test_ssh_config_parsing_cached(temp_ssh_config: Path) -> None:
     # Measure cached access
     latencies = []
     for _ in range(100):
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         config.get_hosts()
-        latencies.append(time.perf_counter() - start)
+        latencies.append(time.perf_counter_ns() - start)
 
-    avg = statistics.mean(latencies) * 1000
-    p95 = statistics.quantiles(latencies, n=20)[18] * 1000
+    avg = statistics.mean(latencies) / 1e6
+    p95 = percentiles(latencies, 0.95)[0] / 1e6
 
     print("\n[PERF] SSH config access (cached, n=100):")
     print(f"  Avg: {avg:.4f}ms")
@@ -142,12 +143,12 @@ def test_host_lookup_performance(temp_ssh_config: Path) -> None:
     # Measure individual lookups
     latencies = []
     for i in range(100):
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         config.get_host(f"host-{i % 10}")
-        latencies.append(time.perf_counter() - start)
+        latencies.append(time.perf_counter_ns() - start)
 
-    avg = statistics.mean(latencies) * 1000
-    p95 = statistics.quantiles(latencies, n=20)[18] * 1000
+    avg = statistics.mean(latencies) / 1e6
+    p95 = percentiles(latencies, 0.95)[0] / 1e6
 
     print("\n[PERF] Individual host lookup (n=100):")
     print(f"  Avg: {avg:.4f}ms")
@@ -191,10 +192,11 @@ def test_regex_parsing_overhead(temp_ssh_config: Path) -> None:
     import re
 
     config_text = temp_ssh_config.read_text()
+    host_re = re.compile(r"^Host\s+(\S+)", re.MULTILINE)
 
-    # Measure raw regex matching
+    # Measure raw regex matching (precompiled, like the parser)
     start = time.perf_counter()
-    host_matches = list(re.finditer(r"^Host\s+(\S+)", config_text, re.MULTILINE))
+    host_matches = list(host_re.finditer(config_text))
     regex_time = time.perf_counter() - start
 
     # Measure full parsing
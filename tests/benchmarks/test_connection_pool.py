@@ -9,6 +9,12 @@ import pytest
 
 from scout_mcp.models import SSHHost
 from scout_mcp.services.pool import ConnectionPool
+from tests.benchmarks._stats import percentiles
+
+try:
+    from pympler import asizeof
+except ImportError:  # pragma: no cover - pympler is optional
+    asizeof = None
 
 
 class MockSSHConnection:
@@ -94,12 +100,12 @@ async def test_warm_connection_latency(
     await pool.get_connection(mock_host)
 
     # Measure warm retrieval
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     await pool.get_connection(mock_host)
-    elapsed = time.perf_counter() - start
+    elapsed_ns = time.perf_counter_ns() - start
 
-    print(f"\n[PERF] Warm connection latency: {elapsed * 1000:.2f}ms")
-    assert elapsed < 0.001, "Warm retrieval should be <1ms (lock + dict lookup)"
+    print(f"\n[PERF] Warm connection latency: {elapsed_ns / 1e6:.2f}ms")
+    assert elapsed_ns < 1_000_000, "Warm retrieval should be <1ms (lock + dict lookup)"
 
 
 @pytest.mark.asyncio
@@ -114,19 +120,18 @@ async def test_concurrent_single_host_lock_contention(
     pool = ConnectionPool()
     num_requests = 100
 
-    async def get_conn() -> float:
-        start = time.perf_counter()
+    async def get_conn() -> int:
+        start = time.perf_counter_ns()
         await pool.get_connection(mock_host)
-        return time.perf_counter() - start
+        return time.perf_counter_ns() - start
 
     # Run concurrent requests
     start_total = time.perf_counter()
     results = await asyncio.gather(*[get_conn() for _ in range(num_requests)])
     elapsed_total = time.perf_counter() - start_total
 
-    avg_latency = statistics.mean(results) * 1000
-    p95_latency = statistics.quantiles(results, n=20)[18] * 1000
-    p99_latency = statistics.quantiles(results, n=100)[98] * 1000
+    avg_latency = statistics.mean(results) / 1e6
+    p95_latency, p99_latency = (p / 1e6 for p in percentiles(results, 0.95, 0.99))
     throughput = num_requests / elapsed_total
 
     print(f"\n[PERF] Concurrent single-host (n={num_requests}):")
@@ -134,10 +139,11 @@ async def test_concurrent_single_host_lock_contention(
     print(f"  P95 latency: {p95_latency:.2f}ms")
     print(f"  P99 latency: {p99_latency:.2f}ms")
     print(f"  Throughput: {throughput:.0f} req/s")
-    print(f"  Connections created: {mock_ssh._connection_count}")
+    print(f"  Connections created: {pool.connections_created}")
 
     # Should reuse single connection
     assert mock_ssh._connection_count == 1, "Should create only 1 connection"
+    assert pool.connections_created == 1
 
 
 @pytest.mark.asyncio
@@ -161,17 +167,17 @@ async def test_concurrent_multi_host_parallelism(
         for i in range(num_hosts)
     ]
 
-    async def get_conn(host: SSHHost) -> float:
-        start = time.perf_counter()
+    async def get_conn(host: SSHHost) -> int:
+        start = time.perf_counter_ns()
         await pool.get_connection(host)
-        return time.perf_counter() - start
+        return time.perf_counter_ns() - start
 
     # Run concurrent requests to different hosts
     start_total = time.perf_counter()
     results = await asyncio.gather(*[get_conn(host) for host in hosts])
     elapsed_total = time.perf_counter() - start_total
 
-    avg_latency = statistics.mean(results) * 1000
+    avg_latency = statistics.mean(results) / 1e6
 
     print(f"\n[PERF] Concurrent multi-host (n={num_hosts}):")
     print(f"  Total time: {elapsed_total * 1000:.2f}ms")
@@ -208,10 +214,11 @@ async def test_pool_memory_footprint(
         for i in range(100)
     ]
 
-    for host in hosts:
-        await pool.get_connection(host)
+    # Dial concurrently, as production callers do
+    await asyncio.gather(*(pool.get_connection(host) for host in hosts))
+    assert len(pool._connections) == len(hosts)
 
-    # Measure pool size
+    # Measure pool size (shallow: containers and wrappers only)
     pool_size = sys.getsizeof(pool._connections)
     pooled_conn_size = sum(sys.getsizeof(pc) for pc in pool._connections.values())
     total_size = pool_size + pooled_conn_size
@@ -219,7 +226,14 @@ async def test_pool_memory_footprint(
     print("\n[PERF] Memory footprint (100 connections):")
     print(f"  Pool dict: {pool_size} bytes")
     print(f"  Pooled connections: {pooled_conn_size} bytes")
-    print(f"  Total: {total_size} bytes ({total_size / 1024:.1f} KB)")
+    print(f"  Total (shallow): {total_size} bytes ({total_size / 1024:.1f} KB)")
+
+    # Deep size follows references into keys, connections and timestamps
+    if asizeof is not None:
+        deep_size = asizeof.asizeof(pool._connections)
+        print(f"  Total (deep): {deep_size} bytes ({deep_size / 1024:.1f} KB)")
+    else:
+        print("  Total (deep): install pympler for a reference-walking size")
 
 
 @pytest.mark.asyncio
@@ -236,16 +250,18 @@ async def test_cleanup_task_overhead(
     # Create connection to start cleanup task
     await pool.get_connection(mock_host)
 
-    # Measure latency during cleanup cycles
+    # Measure latency during cleanup cycles. With idle_timeout=1 the cleanup
+    # interval is 1 // 2 == 0 s, so a cleanup pass runs on every loop
+    # iteration and a short wait already interleaves several of them
     latencies = []
     for _ in range(10):
-        await asyncio.sleep(0.6)  # Wait for cleanup cycle
-        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        start = time.perf_counter_ns()
         await pool.get_connection(mock_host)
-        latencies.append(time.perf_counter() - start)
+        latencies.append(time.perf_counter_ns() - start)
 
-    avg_latency = statistics.mean(latencies) * 1000
-    max_latency = max(latencies) * 1000
+    avg_latency = statistics.mean(latencies) / 1e6
+    max_latency = max(latencies) / 1e6
 
     print("\n[PERF] Cleanup task overhead:")
     print(f"  Avg latency: {avg_latency:.2f}ms")
@@ -3,7 +3,7 @@
 import asyncio
 import statistics
 import time
-from pathlib import Path
+from collections.abc import Iterator
 from typing import Any
 
 import pytest
@@ -11,48 +11,18 @@ import pytest
 import scout_mcp.services.state as state_module
 from scout_mcp.config import Config
 from scout_mcp.tools import scout
+from tests.benchmarks._mocks import MockSSHConnection
+from tests.benchmarks._stats import percentiles
 
 
-class MockSSHResult:
-    """Mock SSH result."""
+@pytest.fixture(scope="module")
+def temp_config(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Config]:
+    """Create test config.
 
-    def __init__(self, returncode: int, stdout: str, stderr: str = "") -> None:
-        """Initialize mock result."""
-        self.returncode = returncode
-        self.stdout = stdout
-        self.stderr = stderr
-
-
-class MockSSHConnection:
-    """Mock SSH connection."""
-
-    def __init__(self, latency: float = 0.005) -> None:
-        """Initialize mock connection."""
-        self._latency = latency
-        self.is_closed = False
-
-    async def run(self, command: str, check: bool = True) -> MockSSHResult:
-        """Mock command execution."""
-        await asyncio.sleep(self._latency)
-
-        if "stat" in command:
-            return MockSSHResult(0, "regular file")
-        elif "head" in command:
-            return MockSSHResult(0, "file contents\n" * 100)
-        elif "ls" in command:
-            return MockSSHResult(0, "-rw-r--r-- 1 user group 1234 file.txt\n" * 50)
-        else:
-            return MockSSHResult(0, "output")
-
-    def close(self) -> None:
-        """Close connection."""
-        self.is_closed = True
-
-
-@pytest.fixture
-def temp_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Config:
-    """Create test config."""
-    config_path = tmp_path / "ssh_config"
+    Module-scoped so the SSH config is written and parsed once for all
+    benchmarks here; each test still starts from a fresh pool.
+    """
+    config_path = tmp_path_factory.mktemp("cfg") / "ssh_config"
     lines = []
     for i in range(10):
         lines.append(f"Host host-{i}")
@@ -69,15 +39,13 @@ def temp_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Config:
     # Mock asyncssh
     async def mock_connect(*args: Any, **kwargs: Any) -> MockSSHConnection:
         await asyncio.sleep(0.005)
-        return MockSSHConnection()
+        return MockSSHConnection(latency=0.005)
 
     import scout_mcp.services.pool as pool_module
 
-    monkeypatch.setattr(
-        pool_module, "asyncssh", type("", (), {"connect": mock_connect})()
-    )
-
-    return config
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(pool_module, "asyncssh", type("", (), {"connect": mock_connect})())
+        yield config
 
 
 @pytest.mark.asyncio
@@ -111,22 +79,21 @@ async def test_full_request_latency_warm(
     state_module._config = temp_config
     state_module._pool = None
 
-    # Prime the pool
-    await scout("host-0:/test/file.txt")
+    # Open the connection up front instead of paying stat+cat on a priming call
+    pool = state_module.get_pool()
+    host = temp_config.get_host("host-0")
+    assert host is not None
+    assert await pool.warm([host]) == 1
 
     # Measure warm request
     latencies = []
     for _ in range(10):
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         await scout("host-0:/test/file.txt")
-        latencies.append(time.perf_counter() - start)
+        latencies.append(time.perf_counter_ns() - start)
 
-    avg = statistics.mean(latencies) * 1000
-    p95 = (
-        statistics.quantiles(latencies, n=20)[18] * 1000
-        if len(latencies) >= 20
-        else max(latencies) * 1000
-    )
+    avg = statistics.mean(latencies) / 1e6
+    p95 = percentiles(latencies, 0.95)[0] / 1e6
 
     print("\n[PERF] Full request (warm connection, n=10):")
     print(f"  Avg: {avg:.2f}ms")
@@ -144,17 +111,19 @@ async def test_concurrent_requests_same_host(
 
     num_requests = 50
 
-    async def make_request() -> float:
-        start = time.perf_counter()
+    async def make_request() -> int:
+        start = time.perf_counter_ns()
         await scout("host-0:/test/file.txt")
-        return time.perf_counter() - start
+        return time.perf_counter_ns() - start
 
     start_total = time.perf_counter()
-    results = await asyncio.gather(*[make_request() for _ in range(num_requests)])
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(make_request()) for _ in range(num_requests)]
+    results = [task.result() for task in tasks]
     elapsed_total = time.perf_counter() - start_total
 
-    avg = statistics.mean(results) * 1000
-    p95 = statistics.quantiles(results, n=20)[18] * 1000
+    avg = statistics.mean(results) / 1e6
+    p95 = percentiles(results, 0.95)[0] / 1e6
     throughput = num_requests / elapsed_total
 
     print(f"\n[PERF] Concurrent requests same host (n={num_requests}):")
@@ -163,35 +132,64 @@ async def test_concurrent_requests_same_host(
     print(f"  P95 latency: {p95:.2f}ms")
     print(f"  Throughput: {throughput:.0f} req/s")
 
+    # All 50 cold requests share the one connection the first one opened
+    assert state_module._pool is not None
+    assert state_module._pool.connections_created == 1
+
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize("pre_warmed", [False, True], ids=["cold", "pre-warmed"])
 async def test_concurrent_requests_different_hosts(
     temp_config: Config,
     monkeypatch: pytest.MonkeyPatch,
+    pre_warmed: bool,
 ) -> None:
-    """Benchmark concurrent requests to different hosts."""
+    """Benchmark concurrent requests to different hosts.
+
+    Run cold (each request also opens its connection) and with all hosts
+    pre-warmed, to separate connect cost from steady-state request cost.
+    """
     state_module._config = temp_config
     state_module._pool = None
 
     num_hosts = 10
-
-    async def make_request(host_id: int) -> float:
-        start = time.perf_counter()
+    # Serial connects would take at least this long (mock connect is 5ms)
+    serial_connect_s = num_hosts * 0.005
+
+    if pre_warmed:
+        hosts = [temp_config.get_host(f"host-{i}") for i in range(num_hosts)]
+        start_warm = time.perf_counter()
+        warmed = await state_module.get_pool().warm(
+            [host for host in hosts if host is not None]
+        )
+        elapsed_warm = time.perf_counter() - start_warm
+        assert warmed == num_hosts
+        assert elapsed_warm < serial_connect_s, "Pool serialized connects"
+
+    async def make_request(host_id: int) -> int:
+        start = time.perf_counter_ns()
         await scout(f"host-{host_id}:/test/file.txt")
-        return time.perf_counter() - start
+        return time.perf_counter_ns() - start
 
     start_total = time.perf_counter()
-    results = await asyncio.gather(*[make_request(i) for i in range(num_hosts)])
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(make_request(i)) for i in range(num_hosts)]
+    results = [task.result() for task in tasks]
     elapsed_total = time.perf_counter() - start_total
 
-    avg = statistics.mean(results) * 1000
+    avg = statistics.mean(results) / 1e6
     throughput = num_hosts / elapsed_total
 
-    print(f"\n[PERF] Concurrent requests different hosts (n={num_hosts}):")
+    label = "pre-warmed" if pre_warmed else "cold"
+    print(f"\n[PERF] Concurrent requests different hosts ({label}, n={num_hosts}):")
     print(f"  Total time: {elapsed_total * 1000:.2f}ms")
     print(f"  Avg latency: {avg:.2f}ms")
     print(f"  Throughput: {throughput:.0f} req/s")
 
+    # Per-host locks let cold requests open their connections in parallel
+    if not pre_warmed:
+        assert elapsed_total < serial_connect_s, "Pool serialized connects"
+
 
 @pytest.mark.asyncio
 async def test_mixed_operation_workload(
@@ -210,20 +208,32 @@ async def test_mixed_operation_workload(
         "hosts",  # list hosts
     ]
 
-    async def run_workload() -> float:
-        start = time.perf_counter()
-        await asyncio.gather(*[scout(op) for op in operations])
-        return time.perf_counter() - start
+    async def run_workload() -> list[int]:
+        """Run one batch and return each op's completion time from batch start."""
+        start = time.perf_counter_ns()
+        tasks = [asyncio.create_task(scout(op)) for op in operations]
+        done_ns = []
+        for fut in asyncio.as_completed(tasks):
+            await fut
+            done_ns.append(time.perf_counter_ns() - start)
+        return done_ns
 
-    results = []
-    for _ in range(10):
-        results.append(await run_workload())
+    batches = [await run_workload() for _ in range(10)]
+
+    # Completions arrive in order, so the last one is the batch time and
+    # last - first is how far the batch's completions are spread out
+    results = [done[-1] for done in batches]
+    op_p50, op_p95 = percentiles((t for done in batches for t in done), 0.50, 0.95)
+    spread = statistics.mean(done[-1] - done[0] for done in batches) / 1e6
 
-    avg = statistics.mean(results) * 1000
-    throughput = len(operations) * len(results) / sum(results)
+    avg = statistics.mean(results) / 1e6
+    throughput = len(operations) * len(results) / (sum(results) / 1e9)
 
     print("\n[PERF] Mixed workload (5 ops x 10 iterations):")
     print(f"  Avg batch time: {avg:.2f}ms")
+    print(f"  Per-op P50: {op_p50 / 1e6:.2f}ms")
+    print(f"  Per-op P95: {op_p95 / 1e6:.2f}ms")
+    print(f"  Completion spread (last - first done): {spread:.2f}ms")
     print(f"  Throughput: {throughput:.0f} ops/s")
 
 
@@ -238,12 +248,12 @@ async def test_hosts_command_performance(
 
     latencies = []
     for _ in range(100):
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         await scout("hosts")
-        latencies.append(time.perf_counter() - start)
+        latencies.append(time.perf_counter_ns() - start)
 
-    avg = statistics.mean(latencies) * 1000
-    p95 = statistics.quantiles(latencies, n=20)[18] * 1000
+    avg = statistics.mean(latencies) / 1e6
+    p95 = percentiles(latencies, 0.95)[0] / 1e6
 
     print("\n[PERF] 'hosts' command (n=100):")
     print(f"  Avg: {avg:.2f}ms")
@@ -6,45 +6,15 @@ import time
 
 import pytest
 
-from scout_mcp.services.executors import cat_file, ls_dir, run_command, stat_path
-
-
-class MockSSHResult:
-    """Mock SSH command result."""
-
-    def __init__(self, returncode: int, stdout: str, stderr: str = "") -> None:
-        """Initialize mock result."""
-        self.returncode = returncode
-        self.stdout = stdout
-        self.stderr = stderr
-
-
-class MockSSHConnection:
-    """Mock SSH connection for benchmarking."""
-
-    def __init__(self, latency: float = 0.001) -> None:
-        """Initialize mock connection."""
-        self._latency = latency
-        self._command_count = 0
-
-    async def run(self, command: str, check: bool = True) -> MockSSHResult:
-        """Mock command execution."""
-        self._command_count += 1
-        await asyncio.sleep(self._latency)
-
-        # Return different outputs based on command
-        if "stat" in command:
-            return MockSSHResult(0, "regular file")
-        elif "head" in command:
-            return MockSSHResult(0, "file contents" * 100)
-        elif "ls" in command:
-            return MockSSHResult(
-                0, "-rw-r--r-- 1 user group 1234 Jan 1 file.txt\n" * 50
-            )
-        elif "timeout" in command:
-            return MockSSHResult(0, "command output")
-        else:
-            return MockSSHResult(0, "")
+from scout_mcp.services.executors import (
+    cat_file,
+    ls_dir,
+    run_command,
+    stat_and_cat,
+    stat_path,
+)
+from tests.benchmarks._mocks import MockSSHConnection, MockSSHResult
+from tests.benchmarks._stats import percentiles
 
 
 @pytest.mark.asyncio
@@ -59,7 +29,7 @@ async def test_stat_path_latency() -> None:
         latencies.append(time.perf_counter() - start)
 
     avg = statistics.mean(latencies) * 1000
-    p95 = statistics.quantiles(latencies, n=20)[18] * 1000
+    p95 = percentiles(latencies, 0.95)[0] * 1000
 
     print("\n[PERF] stat_path (n=100):")
     print(f"  Avg: {avg:.2f}ms")
@@ -79,13 +49,33 @@ async def test_cat_file_latency() -> None:
         latencies.append(time.perf_counter() - start)
 
     avg = statistics.mean(latencies) * 1000
-    p95 = statistics.quantiles(latencies, n=20)[18] * 1000
+    p95 = percentiles(latencies, 0.95)[0] * 1000
 
     print("\n[PERF] cat_file (n=100):")
     print(f"  Avg: {avg:.2f}ms")
     print(f"  P95: {p95:.2f}ms")
 
 
+@pytest.mark.asyncio
+async def test_stat_and_cat_latency() -> None:
+    """Benchmark stat_and_cat (stat + read in one round-trip)."""
+    conn = MockSSHConnection(latency=0.001)
+
+    latencies = []
+    for _ in range(100):
+        start = time.perf_counter()
+        await stat_and_cat(conn, "/test/file.txt", max_size=1048576)
+        latencies.append(time.perf_counter() - start)
+
+    avg = statistics.mean(latencies) * 1000
+    p95 = percentiles(latencies, 0.95)[0] * 1000
+
+    print("\n[PERF] stat_and_cat (n=100):")
+    print(f"  Avg: {avg:.2f}ms")
+    print(f"  P95: {p95:.2f}ms")
+    print(f"  Commands executed: {conn._command_count}")
+
+
 @pytest.mark.asyncio
 async def test_ls_dir_latency() -> None:
     """Benchmark ls_dir operation."""
@@ -98,7 +88,7 @@ async def test_ls_dir_latency() -> None:
         latencies.append(time.perf_counter() - start)
 
     avg = statistics.mean(latencies) * 1000
-    p95 = statistics.quantiles(latencies, n=20)[18] * 1000
+    p95 = percentiles(latencies, 0.95)[0] * 1000
 
     print("\n[PERF] ls_dir (n=100):")
     print(f"  Avg: {avg:.2f}ms")
@@ -117,7 +107,7 @@ async def test_run_command_latency() -> None:
         latencies.append(time.perf_counter() - start)
 
     avg = statistics.mean(latencies) * 1000
-    p95 = statistics.quantiles(latencies, n=20)[18] * 1000
+    p95 = percentiles(latencies, 0.95)[0] * 1000
 
     print("\n[PERF] run_command (n=100):")
     print(f"  Avg: {avg:.2f}ms")
@@ -1,10 +1,58 @@
 """URI parsing performance benchmarks."""
 
 import contextlib
-import statistics
-import time
+import timeit
+from collections.abc import Callable
 
-from scout_mcp.utils.parser import parse_target
+from scout_mcp.utils.parser import parse_target as cached_parse_target
+
+# parse_target memoizes by target string, so time the undecorated function to
+# measure parsing and validation rather than cache hits
+parse_target = cached_parse_target.__wrapped__
+
+# Each timed run repeats the benchmarked callable enough times to take at
+# least MIN_RUN_S, so clock reads and scheduler jitter are amortized over the
+# batch; the loop count is calibrated per benchmark like timeit.autorange()
+MIN_RUN_S = 0.02
+REPEAT = 5
+
+
+def _calibrate(timer: timeit.Timer) -> int:
+    """Return the smallest 1-2-5 loop count whose run takes MIN_RUN_S.
+
+    Args:
+        timer: Timer wrapping the benchmarked callable
+
+    Returns:
+        Number of calls per timed run
+    """
+    scale = 1
+    while True:
+        for step in (1, 2, 5):
+            number = scale * step
+            if timer.timeit(number) >= MIN_RUN_S:
+                return number
+        scale *= 10
+
+
+def _best_avg_ms(
+    func: Callable[[], object], calls_per_run: int = 1
+) -> tuple[float, int]:
+    """Return the best per-call average in ms over REPEAT calibrated runs.
+
+    Args:
+        func: Callable to time
+        calls_per_run: parse_target calls made by one func() invocation
+
+    Returns:
+        Tuple of (average milliseconds per parse_target call in the fastest
+        run, parse_target calls per run)
+    """
+    timer = timeit.Timer(func)
+    number = _calibrate(timer)
+    runs = timer.repeat(repeat=REPEAT, number=number)
+    calls = number * calls_per_run
+    return min(runs) / calls * 1000, calls
 
 
 def test_uri_parsing_latency() -> None:
@@ -17,21 +65,14 @@ def test_uri_parsing_latency() -> None:
         "api:/opt/app/config.json",
     ]
 
-    latencies = []
-    for _ in range(1000):
+    def parse_all() -> None:
         for uri in test_uris:
-            start = time.perf_counter()
             parse_target(uri)
-            latencies.append(time.perf_counter() - start)
 
-    avg = statistics.mean(latencies) * 1000
-    p95 = statistics.quantiles(latencies, n=20)[18] * 1000
-    p99 = statistics.quantiles(latencies, n=100)[98] * 1000
+    avg, calls = _best_avg_ms(parse_all, calls_per_run=len(test_uris))
 
-    print("\n[PERF] URI parsing (n=5000):")
+    print(f"\n[PERF] URI parsing (best of {REPEAT} x {calls}):")
     print(f"  Avg: {avg:.4f}ms")
-    print(f"  P95: {p95:.4f}ms")
-    print(f"  P99: {p99:.4f}ms")
 
     # URI parsing should be <0.01ms
     assert avg < 0.01, "URI parsing should be <0.01ms"
@@ -39,15 +80,9 @@ def test_uri_parsing_latency() -> None:
 
 def test_hosts_command_parsing() -> None:
     """Benchmark 'hosts' command parsing."""
-    latencies = []
-    for _ in range(1000):
-        start = time.perf_counter()
-        parse_target("hosts")
-        latencies.append(time.perf_counter() - start)
+    avg, calls = _best_avg_ms(lambda: parse_target("hosts"))
 
-    avg = statistics.mean(latencies) * 1000
-
-    print("\n[PERF] 'hosts' command parsing (n=1000):")
+    print(f"\n[PERF] 'hosts' command parsing (best of {REPEAT} x {calls}):")
     print(f"  Avg: {avg:.4f}ms")
 
     assert avg < 0.01
@@ -57,32 +92,36 @@ def test_long_path_parsing() -> None:
     """Benchmark parsing of long paths."""
     long_path = "host:" + "/very/long/path" * 20
 
-    latencies = []
-    for _ in range(1000):
-        start = time.perf_counter()
-        parse_target(long_path)
-        latencies.append(time.perf_counter() - start)
-
-    avg = statistics.mean(latencies) * 1000
+    avg, calls = _best_avg_ms(lambda: parse_target(long_path))
 
-    print("\n[PERF] Long path parsing (n=1000):")
+    print(f"\n[PERF] Long path parsing (best of {REPEAT} x {calls}):")
     print(f"  Path length: {len(long_path)} chars")
     print(f"  Avg: {avg:.4f}ms")
 
 
 def test_error_case_performance() -> None:
     """Benchmark error path (invalid URI)."""
-    latencies = []
-    for _ in range(1000):
-        start = time.perf_counter()
+
+    def parse_invalid() -> None:
         with contextlib.suppress(ValueError):
             parse_target("invalid-uri")
-        latencies.append(time.perf_counter() - start)
 
-    avg = statistics.mean(latencies) * 1000
+    avg, calls = _best_avg_ms(parse_invalid)
 
-    print("\n[PERF] Error case (invalid URI, n=1000):")
+    print(f"\n[PERF] Error case (invalid URI, best of {REPEAT} x {calls}):")
     print(f"  Avg: {avg:.4f}ms")
 
     # Error path should not be significantly slower
     assert avg < 0.01
+
+
+def test_cached_parsing() -> None:
+    """Benchmark repeated parsing of a target already in the cache."""
+    cached_parse_target("server:/var/log/app.log")
+
+    avg, calls = _best_avg_ms(lambda: cached_parse_target("server:/var/log/app.log"))
+
+    print(f"\n[PERF] Cached URI parsing (best of {REPEAT} x {calls}):")
+    print(f"  Avg: {avg:.4f}ms")
+
+    assert avg < 0.001
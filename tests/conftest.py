@@ -0,0 +1,42 @@
+"""Shared fixtures for the Scout MCP test suite."""
+
+import pytest
+
+import scout_mcp.services.connection as connection_module
+from scout_mcp.config.parser import SSHConfigParser
+from tests._mocks import MockSSHFactory, make_mock_ssh
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry failed connections without the jittered pause.
+
+    Only the retry delay is zeroed; asyncio.sleep itself stays real, since
+    the pool concurrency tests rely on it to interleave tasks.
+    """
+    monkeypatch.setattr(connection_module, "RETRY_BASE_DELAY", 0.0)
+
+
+@pytest.fixture(autouse=True)
+def clear_ssh_config_cache() -> None:
+    """Start every test with an empty SSH config parse cache.
+
+    The cache is keyed on (mtime_ns, size), so a tmp_path config rewritten
+    to the same size within one mtime tick could otherwise reuse hosts
+    parsed by an earlier test.
+    """
+    SSHConfigParser.clear_cache()
+
+
+@pytest.fixture(scope="session")
+def mock_ssh_factory() -> MockSSHFactory:
+    """Build a mock SSH connection wired to a mock SFTP client.
+
+    Returns a factory rather than mocks so every test gets fresh call
+    records. Patch ``asyncssh.connect`` to return the connection.
+
+    Returns:
+        Factory taking optional ``get_side_effect``/``put_side_effect`` and
+        returning ``(mock_conn, mock_sftp)``
+    """
+    return make_mock_ssh
@@ -1,12 +1,12 @@
 """Integration tests for beam (file transfer) functionality."""
 
-import tempfile
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from scout_mcp.tools.scout import scout
+from tests._mocks import MockSSHFactory
 
 
 @pytest.fixture
@@ -23,7 +23,9 @@ Host testhost
 
 
 @pytest.mark.asyncio
-async def test_beam_roundtrip(mock_ssh_config: Path) -> None:
+async def test_beam_roundtrip(
+    mock_ssh_config: Path, tmp_path: Path, mock_ssh_factory: MockSSHFactory
+) -> None:
     """Test uploading and downloading a file."""
     from scout_mcp.config import Config
     from scout_mcp.services import reset_state, set_config
@@ -31,62 +33,44 @@ async def test_beam_roundtrip(mock_ssh_config: Path) -> None:
     reset_state()
     set_config(Config.from_ssh_config(ssh_config_path=mock_ssh_config))
 
-    # Create temp file with known content
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        original_content = "test beam content\nline 2\n"
-        f.write(original_content)
-        local_source = f.name
+    # Create local file with known content
+    original_content = "test beam content\nline 2\n"
+    local_source = tmp_path / "source.txt"
+    local_source.write_text(original_content)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        try:
-            remote_path = "/tmp/beam_test_remote.txt"
-            local_dest = f"{tmpdir}/downloaded.txt"
+    remote_path = "/tmp/beam_test_remote.txt"
+    local_dest = tmp_path / "downloaded.txt"
 
-            # Mock SSH connection and SFTP
-            mock_conn = AsyncMock()
-            mock_conn.is_closed = False
+    # Mock get() to create the file so the handler can stat it
+    async def mock_get(src: str, dst: str) -> None:
+        Path(dst).write_text(original_content)
 
-            # Mock SFTP client as async context manager
-            mock_sftp = AsyncMock()
-            mock_sftp.put = AsyncMock()
+    mock_conn, _ = mock_ssh_factory(get_side_effect=mock_get)
 
-            # Mock get() to create the file so the handler can stat it
-            async def mock_get(src: str, dst: str) -> None:
-                Path(dst).write_text(original_content)
-
-            mock_sftp.get = AsyncMock(side_effect=mock_get)
-
-            # Mock the start_sftp_client() to return a proper async context manager
-            mock_sftp_ctx = AsyncMock()
-            mock_sftp_ctx.__aenter__ = AsyncMock(return_value=mock_sftp)
-            mock_sftp_ctx.__aexit__ = AsyncMock(return_value=None)
-            mock_conn.start_sftp_client = MagicMock(return_value=mock_sftp_ctx)
-
-            with patch("asyncssh.connect", new_callable=AsyncMock) as mock_connect:
-                mock_connect.return_value = mock_conn
-
-                # Upload
-                upload_result = await scout(
-                    target=f"testhost:{remote_path}", beam=local_source
-                )
+    with patch("asyncssh.connect", new_callable=AsyncMock) as mock_connect:
+        mock_connect.return_value = mock_conn
 
-                assert "uploaded" in upload_result.lower()
-                assert "error" not in upload_result.lower()
+        # Upload
+        upload_result = await scout(
+            target=f"testhost:{remote_path}", beam=str(local_source)
+        )
 
-                # Download
-                download_result = await scout(
-                    target=f"testhost:{remote_path}", beam=local_dest
-                )
+        assert "uploaded" in upload_result.lower()
+        assert "error" not in upload_result.lower()
 
-                assert "downloaded" in download_result.lower()
-                assert "error" not in download_result.lower()
+        # Download
+        download_result = await scout(
+            target=f"testhost:{remote_path}", beam=str(local_dest)
+        )
 
-        finally:
-            Path(local_source).unlink(missing_ok=True)
+        assert "downloaded" in download_result.lower()
+        assert "error" not in download_result.lower()
 
 
 @pytest.mark.asyncio
-async def test_beam_with_nonexistent_remote(mock_ssh_config: Path) -> None:
+async def test_beam_with_nonexistent_remote(
+    mock_ssh_config: Path, tmp_path: Path, mock_ssh_factory: MockSSHFactory
+) -> None:
     """Test beam handles nonexistent remote files gracefully."""
     from scout_mcp.config import Config
     from scout_mcp.services import reset_state, set_config
@@ -94,29 +78,14 @@ async def test_beam_with_nonexistent_remote(mock_ssh_config: Path) -> None:
     reset_state()
     set_config(Config.from_ssh_config(ssh_config_path=mock_ssh_config))
 
-    # Mock SSH connection and SFTP
-    mock_conn = AsyncMock()
-    mock_conn.is_closed = False
-
-    # Mock SFTP client as async context manager
-    mock_sftp = AsyncMock()
     # Mock SFTP to raise error for nonexistent file
-    mock_sftp.get = AsyncMock(side_effect=FileNotFoundError("No such file"))
-
-    # Mock the start_sftp_client() to return a proper async context manager
-    mock_sftp_ctx = AsyncMock()
-    mock_sftp_ctx.__aenter__ = AsyncMock(return_value=mock_sftp)
-    mock_sftp_ctx.__aexit__ = AsyncMock(return_value=None)
-    mock_conn.start_sftp_client = MagicMock(return_value=mock_sftp_ctx)
-
-    with (
-        tempfile.TemporaryDirectory() as tmpdir,
-        patch("asyncssh.connect", new_callable=AsyncMock) as mock_connect,
-    ):
+    mock_conn, _ = mock_ssh_factory(get_side_effect=FileNotFoundError("No such file"))
+
+    with patch("asyncssh.connect", new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_conn
 
         result = await scout(
-            target="testhost:/nonexistent/file.txt", beam=f"{tmpdir}/output.txt"
+            target="testhost:/nonexistent/file.txt", beam=str(tmp_path / "output.txt")
         )
 
         assert "error" in result.lower() or "failed" in result.lower()
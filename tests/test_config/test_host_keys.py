@@ -42,6 +42,16 @@ def test_verifier_disabled_with_none() -> None:
     assert not verifier.is_enabled()
 
 
+def test_verifier_caches_disabled_result(tmp_path: Path) -> None:
+    """A None (disabled) result is resolved once, not on every access."""
+    missing = tmp_path / "nonexistent"
+    verifier = HostKeyVerifier(known_hosts_path=str(missing), strict_checking=False)
+    assert verifier.get_known_hosts_path() is None
+
+    missing.touch()
+    assert verifier.get_known_hosts_path() is None
+
+
 def test_verifier_raises_on_missing_file_strict_mode(tmp_path: Path) -> None:
     """Verifier raises if file missing in strict mode (lazy evaluation)."""
     missing = tmp_path / "nonexistent"
@@ -68,6 +78,16 @@ def test_verifier_is_enabled_when_path_set(tmp_path: Path) -> None:
     assert verifier.is_enabled()
 
 
+def test_verifier_is_disabled_when_strict_file_missing(tmp_path: Path) -> None:
+    """is_enabled() reports a cached resolution error as disabled."""
+    missing = tmp_path / "nonexistent"
+    verifier = HostKeyVerifier(known_hosts_path=str(missing), strict_checking=True)
+    assert not verifier.is_enabled()
+    assert not verifier.is_enabled()
+    with pytest.raises(FileNotFoundError):
+        verifier.get_known_hosts_path()
+
+
 def test_verifier_is_disabled_when_path_none() -> None:
     """Verifier is disabled when path is None."""
     verifier = HostKeyVerifier(known_hosts_path="none")
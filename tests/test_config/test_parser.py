@@ -1,9 +1,11 @@
 """Tests for SSHConfigParser."""
 
+import os
 from pathlib import Path
 
 import pytest
 
+import scout_mcp.config.parser as parser_module
 from scout_mcp.config.parser import SSHConfigParser
 from scout_mcp.models import SSHHost
 
@@ -70,6 +72,50 @@ Host blocked
     assert "blocked" not in hosts
 
 
+def test_parse_filters_support_globs(tmp_path: Path) -> None:
+    """Allowlist and blocklist entries are matched as shell-style globs."""
+    ssh_config = tmp_path / "ssh_config"
+    ssh_config.write_text("""
+Host prod-web
+    HostName 10.0.0.1
+
+Host prod-db
+    HostName 10.0.0.2
+
+Host staging-web
+    HostName 10.0.0.3
+
+Host prod-backup
+    HostName 10.0.0.4
+""")
+    allowed = SSHConfigParser(ssh_config, allowlist=["prod-*", "staging-web"])
+    assert set(allowed.parse()) == {"prod-web", "prod-db", "staging-web", "prod-backup"}
+
+    blocked = SSHConfigParser(ssh_config, blocklist=["*-backup", "prod-d?"])
+    assert set(blocked.parse()) == {"prod-web", "staging-web"}
+
+    mixed = SSHConfigParser(ssh_config, blocklist=["prod-*", "staging-web"])
+    assert mixed.parse() == {}
+
+
+def test_parse_interns_repeated_strings(tmp_path: Path) -> None:
+    """Repeated field values share one string object across hosts."""
+    ssh_config = tmp_path / "ssh_config"
+    ssh_config.write_text("""
+Host one
+    HostName 10.0.0.1
+    User deploy
+
+Host two
+    HostName 10.0.0.2
+    User deploy
+""")
+    hosts = SSHConfigParser(ssh_config).parse()
+
+    assert hosts["one"].user is hosts["two"].user
+    assert next(name for name in hosts if name == "one") is hosts["one"].name
+
+
 def test_parse_missing_config_returns_empty(tmp_path: Path) -> None:
     """Parser returns empty dict for missing config file."""
     parser = SSHConfigParser(tmp_path / "nonexistent")
@@ -78,6 +124,49 @@ def test_parse_missing_config_returns_empty(tmp_path: Path) -> None:
     assert len(hosts) == 0
 
 
+def test_parse_tolerates_undecodable_bytes(tmp_path: Path) -> None:
+    """Invalid UTF-8 in the config is replaced instead of aborting the parse."""
+    ssh_config = tmp_path / "ssh_config"
+    ssh_config.write_bytes(b"# caf\xe9\nHost web\n    HostName 10.0.0.1\n")
+    parser = SSHConfigParser(ssh_config)
+
+    assert list(parser.parse()) == ["web"]
+
+
+def test_parse_survives_short_reads(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The whole config is parsed even when os.read returns partial data."""
+    ssh_config = tmp_path / "ssh_config"
+    ssh_config.write_text("Host web\n    HostName 10.0.0.1\n    User deploy\n")
+    real_read = os.read
+    monkeypatch.setattr(
+        parser_module.os, "read", lambda fd, n: real_read(fd, min(n, 8))
+    )
+
+    hosts = SSHConfigParser(ssh_config).parse()
+
+    assert hosts["web"].hostname == "10.0.0.1"
+    assert hosts["web"].user == "deploy"
+
+
+def test_read_fd_reads_to_eof_when_size_is_zero() -> None:
+    """Pipes report st_size 0 but still have content to read."""
+    read_fd, write_fd = os.pipe()
+    try:
+        os.write(write_fd, b"Host web\n")
+        os.close(write_fd)
+        assert parser_module._read_fd(read_fd, 0) == "Host web\n"
+    finally:
+        os.close(read_fd)
+
+
+def test_parse_directory_returns_empty(tmp_path: Path) -> None:
+    """A config path that cannot be read as a file yields no hosts."""
+    parser = SSHConfigParser(tmp_path)
+    assert parser.parse() == {}
+
+
 def test_parse_empty_config_returns_empty(tmp_path: Path) -> None:
     """Parser returns empty dict for empty config file."""
     ssh_config = tmp_path / "ssh_config"
@@ -142,6 +231,117 @@ Host complete
     assert "complete" in hosts
 
 
+def test_parse_tokenizes_directives(tmp_path: Path) -> None:
+    """Parser handles keyword case, extra patterns and malformed lines."""
+    ssh_config = tmp_path / "ssh_config"
+    ssh_config.write_text("""
+Host
+HOST alpha alpha-alias
+\tHOSTNAME   10.0.0.1
+    user\tdeploy
+    Port=2200
+    Port
+""")
+    parser = SSHConfigParser(ssh_config)
+    hosts = parser.parse()
+
+    assert list(hosts) == ["alpha"]
+    assert hosts["alpha"].hostname == "10.0.0.1"
+    assert hosts["alpha"].user == "deploy"
+    assert hosts["alpha"].port == 22
+
+
+def test_parse_reuses_cached_hosts(
+    sample_ssh_config: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An unchanged file is not re-read, even by a new parser instance."""
+    first = SSHConfigParser(sample_ssh_config).parse()
+
+    def fail_read(fd: int, size: int) -> str:
+        raise AssertionError("config file was re-read")
+
+    monkeypatch.setattr(parser_module, "_read_fd", fail_read)
+    second = SSHConfigParser(sample_ssh_config).parse()
+
+    assert second == first
+    assert second is not first
+
+
+def test_parse_cache_hands_out_copies(sample_ssh_config: Path) -> None:
+    """Mutating hosts from one parse doesn't leak into later ones."""
+    first = SSHConfigParser(sample_ssh_config).parse()
+    first["test-host"].user = "changed"
+
+    second = SSHConfigParser(sample_ssh_config).parse()
+
+    assert second["test-host"] is not first["test-host"]
+    assert second["test-host"].user == "admin"
+
+
+def test_parse_cache_keyed_on_home(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """IdentityFile "~" is re-expanded when the home directory changes."""
+    ssh_config = tmp_path / "ssh_config"
+    ssh_config.write_text(
+        "Host web\n    HostName 10.0.0.1\n    IdentityFile ~/.ssh/id_web\n"
+    )
+    monkeypatch.setenv("HOME", "/home/alice")
+    parser = SSHConfigParser(ssh_config)
+    assert parser.parse()["web"].identity_file == "/home/alice/.ssh/id_web"
+
+    monkeypatch.setenv("HOME", "/home/bob")
+    assert parser.parse()["web"].identity_file == "/home/bob/.ssh/id_web"
+
+
+def test_parse_cache_keyed_on_size_and_filters(tmp_path: Path) -> None:
+    """Edits and different allow/blocklists are parsed afresh."""
+    ssh_config = tmp_path / "ssh_config"
+    ssh_config.write_text("Host a\n    HostName 10.0.0.1\n")
+    assert list(SSHConfigParser(ssh_config).parse()) == ["a"]
+
+    ssh_config.write_text("Host a\n    HostName 10.0.0.1\nHost b\n    HostName b\n")
+    assert list(SSHConfigParser(ssh_config).parse()) == ["a", "b"]
+    assert list(SSHConfigParser(ssh_config, blocklist=["a"]).parse()) == ["b"]
+
+
+def test_parse_cache_replaces_stale_entry(tmp_path: Path) -> None:
+    """A rewritten file replaces its cache entry; a deleted one drops it."""
+    ssh_config = tmp_path / "ssh_config"
+    ssh_config.write_text("Host a\n    HostName 10.0.0.1\n")
+    parser = SSHConfigParser(ssh_config)
+    parser.parse()
+
+    ssh_config.write_text("Host a\n    HostName 10.0.0.2\nHost b\n    HostName b\n")
+    assert parser.parse()["a"].hostname == "10.0.0.2"
+    entries = [k for k in parser_module._parse_cache if k[0] == str(ssh_config)]
+    assert len(entries) == 1
+
+    ssh_config.unlink()
+    assert parser.parse() == {}
+    assert all(k[0] != str(ssh_config) for k in parser_module._parse_cache)
+
+
+def test_clear_cache_forces_reparse(
+    sample_ssh_config: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """clear_cache() drops cached results."""
+    SSHConfigParser(sample_ssh_config).parse()
+    SSHConfigParser.clear_cache()
+
+    calls = []
+    real_read = parser_module._read_fd
+
+    def counting_read(fd: int, size: int) -> str:
+        calls.append(fd)
+        return real_read(fd, size)
+
+    monkeypatch.setattr(parser_module, "_read_fd", counting_read)
+    SSHConfigParser(sample_ssh_config).parse()
+
+    assert len(calls) == 1
+
+
 def test_parse_defaults_to_home_ssh_config() -> None:
     """Parser defaults to ~/.ssh/config when no path provided."""
     parser = SSHConfigParser()
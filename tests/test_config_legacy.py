@@ -126,6 +126,99 @@ def test_empty_ssh_config(tmp_path: Path) -> None:
     assert len(hosts) == 0
 
 
+def test_get_hosts_cached_until_config_changes(tmp_path: Path) -> None:
+    """get_hosts reuses parsed hosts and re-parses when the file changes."""
+    import os
+
+    ssh_config = tmp_path / "config"
+    ssh_config.write_text("Host one\n    HostName 10.0.0.1\n")
+
+    config = create_test_config(ssh_config_path=ssh_config)
+    hosts = config.get_hosts()
+    assert list(hosts) == ["one"]
+    assert config.get_hosts() is hosts
+
+    ssh_config.write_text("Host two\n    HostName 10.0.0.2\n")
+    stat = ssh_config.stat()
+    os.utime(ssh_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert list(config.get_hosts()) == ["two"]
+
+
+def test_get_hosts_reparses_on_size_change_within_mtime_tick(
+    tmp_path: Path,
+) -> None:
+    """A rewrite that keeps the mtime but changes the size is picked up."""
+    import os
+
+    ssh_config = tmp_path / "config"
+    ssh_config.write_text("Host one\n    HostName 10.0.0.1\n")
+    mtime = ssh_config.stat().st_mtime_ns
+    config = create_test_config(ssh_config_path=ssh_config)
+    assert list(config.get_hosts()) == ["one"]
+
+    ssh_config.write_text("Host one\n    HostName 10.0.0.1\nHost two\n    HostName b\n")
+    os.utime(ssh_config, ns=(mtime, mtime))
+
+    assert list(config.get_hosts()) == ["one", "two"]
+
+
+def test_get_host_endpoints_sorted_and_cached(tmp_path: Path) -> None:
+    """Host endpoints are name-sorted and rebuilt only when hosts re-parse."""
+    ssh_config = tmp_path / "config"
+    ssh_config.write_text("""
+Host zeta
+    HostName 10.0.0.2
+    Port 2222
+
+Host alpha
+    HostName 10.0.0.1
+""")
+
+    config = create_test_config(ssh_config_path=ssh_config)
+    endpoints = config.get_host_endpoints()
+
+    assert list(endpoints.items()) == [
+        ("alpha", ("10.0.0.1", 22)),
+        ("zeta", ("10.0.0.2", 2222)),
+    ]
+    assert config.get_host_endpoints() is endpoints
+
+
+def test_get_hosts_and_endpoints_share_one_snapshot(tmp_path: Path) -> None:
+    """Hosts and endpoints come from the same parse after the config changes."""
+    import os
+
+    ssh_config = tmp_path / "config"
+    ssh_config.write_text("Host one\n    HostName 10.0.0.1\n")
+    config = create_test_config(ssh_config_path=ssh_config)
+    config.get_hosts()
+
+    ssh_config.write_text("Host one\n    HostName 10.0.0.1\nHost two\n    HostName b\n")
+    st = ssh_config.stat()
+    os.utime(ssh_config, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    hosts, endpoints = config.get_hosts_and_endpoints()
+
+    assert list(endpoints) == ["one", "two"]
+    assert all(name in hosts for name in endpoints)
+
+
+def test_empty_ssh_config_is_parsed_once(tmp_path: Path) -> None:
+    """An empty host list is cached rather than re-parsed on every call."""
+    from unittest.mock import patch
+
+    ssh_config = tmp_path / "config"
+    ssh_config.write_text("")
+
+    config = create_test_config(ssh_config_path=ssh_config)
+    with patch.object(config.parser, "parse", wraps=config.parser.parse) as parse:
+        config.get_hosts()
+        config.get_hosts()
+
+    assert parse.call_count == 1
+
+
 def test_ssh_config_with_comments_only(tmp_path: Path) -> None:
     """SSH config with only comments returns no hosts."""
     ssh_config = tmp_path / "config"
@@ -258,6 +351,17 @@ def test_invalid_env_var_uses_default(tmp_path: Path, monkeypatch) -> None:
     assert config.max_file_size == 1_048_576  # default
 
 
+def test_allowlist_and_blocklist_from_env(monkeypatch) -> None:
+    """Comma-separated SCOUT_ALLOWLIST/SCOUT_BLOCKLIST entries are stripped."""
+    monkeypatch.setenv("SCOUT_ALLOWLIST", " web , db,, ")
+    monkeypatch.setenv("SCOUT_BLOCKLIST", " , ")
+
+    config = Config.from_env()
+
+    assert config.parser.allowlist == {"web", "db"}
+    assert config.parser.blocklist == set()
+
+
 class TestTransportConfig:
     """Tests for transport configuration."""
 
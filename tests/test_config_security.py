@@ -9,6 +9,7 @@ from pathlib import Path
 
 import pytest
 
+import scout_mcp.config.host_keys as host_keys_module
 from scout_mcp.config import Config
 
 
@@ -87,6 +88,22 @@ def test_known_hosts_none_disables_with_warning(
         assert "MITM" in security_warnings[0].message or "man-in-the-middle" in security_warnings[0].message.lower()
 
 
+def test_known_hosts_none_warns_once_per_config(
+    temp_ssh_config: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeated known_hosts_path accesses do not repeat the critical warning."""
+    monkeypatch.setenv("SCOUT_SSH_CONFIG", str(temp_ssh_config))
+    monkeypatch.setenv("SCOUT_KNOWN_HOSTS", "none")
+    warnings: list[str] = []
+    monkeypatch.setattr(host_keys_module.logger, "critical", warnings.append)
+
+    config = Config.from_env()
+    for _ in range(3):
+        assert config.known_hosts_path is None
+
+    assert len(warnings) == 1
+
+
 def test_custom_path_works_when_exists(
     temp_ssh_config: Path, temp_known_hosts: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
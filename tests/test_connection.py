@@ -19,6 +19,15 @@ def mock_pool() -> Generator[Any, None, None]:
         yield mock.return_value
 
 
+@pytest.fixture
+def mock_uniform() -> Generator[MagicMock, None, None]:
+    """Record the jittered retry delay and pick zero, so no time is spent."""
+    with patch(
+        "scout_mcp.services.connection.random.uniform", return_value=0.0
+    ) as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_host() -> MagicMock:
     """Mock SSH host configuration."""
@@ -56,6 +65,31 @@ class TestGetConnectionWithRetry:
         assert mock_pool.get_connection.call_count == 2
         mock_pool.remove_connection.assert_called_once_with("test-host")
 
+    @pytest.mark.asyncio
+    async def test_retry_waits_jittered_delay(
+        self, mock_pool: Any, mock_host: Any, mock_uniform: MagicMock
+    ) -> None:
+        """Retry pauses for a random delay within [0, retry_delay]."""
+        mock_pool.get_connection = AsyncMock(
+            side_effect=[Exception("First fail"), AsyncMock()]
+        )
+        mock_pool.remove_connection = AsyncMock()
+
+        await get_connection_with_retry(mock_host, mock_pool, retry_delay=0.5)
+
+        mock_uniform.assert_called_once_with(0, 0.5)
+
+    @pytest.mark.asyncio
+    async def test_no_delay_on_first_try_success(
+        self, mock_pool: Any, mock_host: Any, mock_uniform: MagicMock
+    ) -> None:
+        """No pause when the first attempt succeeds."""
+        mock_pool.get_connection = AsyncMock(return_value=AsyncMock())
+
+        await get_connection_with_retry(mock_host, mock_pool)
+
+        mock_uniform.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_failure_after_retry(self, mock_pool: Any, mock_host: Any) -> None:
         """Connection fails on both attempts."""
@@ -16,10 +16,13 @@ def reset_globals() -> None:
     reset_state()
 
 
-@pytest.fixture
-def mock_ssh_config(tmp_path: Path) -> Path:
-    """Create a temporary SSH config with test hosts."""
-    config_file = tmp_path / "ssh_config"
+@pytest.fixture(scope="module")
+def mock_ssh_config(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary SSH config with test hosts.
+
+    Module-scoped: the tests only read it, so it is written once.
+    """
+    config_file = tmp_path_factory.mktemp("e2e") / "ssh_config"
     config_file.write_text("""
 Host testhost
     HostName 192.168.1.100
@@ -55,10 +58,10 @@ async def test_full_scout_workflow_list_hosts_to_read_file(
     # Step 2: Mock SSH connection for file read
     mock_conn = AsyncMock()
     mock_conn.is_closed = False
-    mock_conn.run.side_effect = [
-        MagicMock(stdout="regular file", returncode=0),  # stat
-        MagicMock(stdout="test-hostname\n", returncode=0),  # cat
-    ]
+    # stat and cat run as one command
+    mock_conn.run.return_value = MagicMock(
+        stdout="regular file\ntest-hostname\n", returncode=0
+    )
 
     with patch("asyncssh.connect", new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_conn
@@ -68,7 +71,7 @@ async def test_full_scout_workflow_list_hosts_to_read_file(
         assert "test-hostname" in file_result
 
         # Verify connection was made
-        assert mock_conn.run.call_count == 2  # stat + cat
+        assert mock_conn.run.call_count == 1  # stat + cat in one round-trip
 
 
 @pytest.mark.asyncio
@@ -128,10 +131,10 @@ async def test_error_recovery_workflow(mock_ssh_config: Path) -> None:
     # Step 2: Mock successful retry
     mock_conn = AsyncMock()
     mock_conn.is_closed = False
-    mock_conn.run.side_effect = [
-        MagicMock(stdout="regular file", returncode=0),  # stat
-        MagicMock(stdout="test-hostname\n", returncode=0),  # cat
-    ]
+    # stat and cat run as one command
+    mock_conn.run.return_value = MagicMock(
+        stdout="regular file\ntest-hostname\n", returncode=0
+    )
 
     with patch("asyncssh.connect", new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_conn
@@ -176,10 +179,10 @@ async def test_workflow_list_directory_then_read_file(
     # Step 2: Read specific file from directory
     mock_conn2 = AsyncMock()
     mock_conn2.is_closed = False
-    mock_conn2.run.side_effect = [
-        MagicMock(stdout="regular file", returncode=0),  # stat
-        MagicMock(stdout="127.0.0.1 localhost\n", returncode=0),  # cat
-    ]
+    # stat and cat run as one command
+    mock_conn2.run.return_value = MagicMock(
+        stdout="regular file\n127.0.0.1 localhost\n", returncode=0
+    )
 
     with patch("asyncssh.connect", new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_conn2
@@ -223,10 +226,10 @@ async def test_workflow_find_files_then_read(mock_ssh_config: Path) -> None:
     # Step 2: Read one of the found files
     mock_conn2 = AsyncMock()
     mock_conn2.is_closed = False
-    mock_conn2.run.side_effect = [
-        MagicMock(stdout="regular file", returncode=0),  # stat
-        MagicMock(stdout="Dec 10 10:00:00 host syslog: message\n", returncode=0),  # cat
-    ]
+    # stat and cat run as one command
+    mock_conn2.run.return_value = MagicMock(
+        stdout="regular file\nDec 10 10:00:00 host syslog: message\n", returncode=0
+    )
 
     with patch("asyncssh.connect", new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_conn2
@@ -254,10 +257,10 @@ async def test_workflow_multiple_hosts(mock_ssh_config: Path) -> None:
     # Step 2: Read from first host
     mock_conn1 = AsyncMock()
     mock_conn1.is_closed = False
-    mock_conn1.run.side_effect = [
-        MagicMock(stdout="regular file", returncode=0),  # stat
-        MagicMock(stdout="testhost-data\n", returncode=0),  # cat
-    ]
+    # stat and cat run as one command
+    mock_conn1.run.return_value = MagicMock(
+        stdout="regular file\ntesthost-data\n", returncode=0
+    )
 
     with patch("asyncssh.connect", new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_conn1
@@ -268,10 +271,10 @@ async def test_workflow_multiple_hosts(mock_ssh_config: Path) -> None:
     # Step 3: Read from second host
     mock_conn2 = AsyncMock()
     mock_conn2.is_closed = False
-    mock_conn2.run.side_effect = [
-        MagicMock(stdout="regular file", returncode=0),  # stat
-        MagicMock(stdout="remotehost-data\n", returncode=0),  # cat
-    ]
+    # stat and cat run as one command
+    mock_conn2.run.return_value = MagicMock(
+        stdout="regular file\nremotehost-data\n", returncode=0
+    )
 
     with patch("asyncssh.connect", new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_conn2
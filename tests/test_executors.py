@@ -10,6 +10,7 @@ from scout_mcp.services.executors import (
     cat_file,
     ls_dir,
     run_command,
+    stat_and_cat,
     stat_path,
 )
 
@@ -114,6 +115,89 @@ async def test_cat_file_no_truncation_when_smaller(mock_connection: AsyncMock) -
     assert was_truncated is False
 
 
+@pytest.mark.asyncio
+async def test_cat_file_truncation_counts_utf8_bytes(
+    mock_connection: AsyncMock,
+) -> None:
+    """Truncation compares encoded size, for both str and bytes output."""
+    text = "é" * 5  # 10 bytes in UTF-8
+
+    mock_connection.run.return_value = MagicMock(stdout=text, returncode=0)
+    assert await cat_file(mock_connection, "/f", max_size=10) == (text, True)
+
+    mock_connection.run.return_value = MagicMock(
+        stdout=text.encode("utf-8"), returncode=0
+    )
+    assert await cat_file(mock_connection, "/f", max_size=11) == (text, False)
+
+
+@pytest.mark.asyncio
+async def test_stat_and_cat_reads_file_in_one_command(
+    mock_connection: AsyncMock,
+) -> None:
+    """stat_and_cat returns type and contents from a single run() call."""
+    mock_connection.run.return_value = MagicMock(
+        stdout="regular file\nline1\nline2\n", returncode=0
+    )
+
+    path_type, content, was_truncated = await stat_and_cat(
+        mock_connection, "/etc/hosts", max_size=1024
+    )
+
+    assert path_type == "file"
+    assert content == "line1\nline2\n"
+    assert was_truncated is False
+    mock_connection.run.assert_called_once()
+    cmd = mock_connection.run.call_args[0][0]
+    assert "stat" in cmd and "head -c 1024" in cmd
+
+
+@pytest.mark.asyncio
+async def test_stat_and_cat_truncation_counts_raw_bytes(
+    mock_connection: AsyncMock,
+) -> None:
+    """Truncation is measured before decoding, as in cat_file."""
+    # One invalid byte decodes to a 3-byte replacement character
+    mock_connection.run.return_value = MagicMock(
+        stdout=b"regular file\n\xff", returncode=0
+    )
+
+    result = await stat_and_cat(mock_connection, "/f", max_size=3)
+
+    assert result == ("file", "\ufffd", False)
+
+
+@pytest.mark.asyncio
+async def test_stat_and_cat_directory(mock_connection: AsyncMock) -> None:
+    """stat_and_cat reports directories without reading them."""
+    mock_connection.run.return_value = MagicMock(stdout="directory\n", returncode=0)
+
+    result = await stat_and_cat(mock_connection, "/var/log", max_size=1024)
+
+    assert result == ("directory", "", False)
+
+
+@pytest.mark.asyncio
+async def test_stat_and_cat_missing_path(mock_connection: AsyncMock) -> None:
+    """stat_and_cat returns None when stat finds nothing."""
+    mock_connection.run.return_value = MagicMock(stdout="", returncode=1)
+
+    result = await stat_and_cat(mock_connection, "/nonexistent", max_size=1024)
+
+    assert result == (None, "", False)
+
+
+@pytest.mark.asyncio
+async def test_stat_and_cat_unreadable_file(mock_connection: AsyncMock) -> None:
+    """stat_and_cat raises when the file exists but head fails."""
+    mock_connection.run.return_value = MagicMock(
+        stdout="regular file\n", stderr="Permission denied", returncode=1
+    )
+
+    with pytest.raises(RuntimeError, match="Permission denied"):
+        await stat_and_cat(mock_connection, "/etc/shadow", max_size=1024)
+
+
 @pytest.mark.asyncio
 async def test_ls_dir_returns_listing(mock_connection: AsyncMock) -> None:
     """ls_dir returns directory listing."""
@@ -340,13 +424,12 @@ async def test_broadcast_read_multiple_hosts() -> None:
 
     # Host 1: file
     conn1.run.side_effect = [
-        MagicMock(stdout="regular file", returncode=0),  # stat_path
-        MagicMock(stdout="content1", returncode=0),  # cat_file
+        MagicMock(stdout="regular file\ncontent1", returncode=0),  # stat_and_cat
     ]
 
     # Host 2: directory
     conn2.run.side_effect = [
-        MagicMock(stdout="directory", returncode=0),  # stat_path
+        MagicMock(stdout="directory\n", returncode=0),  # stat_and_cat
         MagicMock(stdout="drwxr-xr-x 2 root root", returncode=0),  # ls_dir
     ]
 
@@ -381,8 +464,7 @@ async def test_broadcast_read_handles_partial_failure() -> None:
     # First host succeeds
     conn1 = AsyncMock()
     conn1.run.side_effect = [
-        MagicMock(stdout="regular file", returncode=0),  # stat_path
-        MagicMock(stdout="content", returncode=0),  # cat_file
+        MagicMock(stdout="regular file\ncontent", returncode=0),  # stat_and_cat
     ]
 
     # Second host fails - use an async mock that raises
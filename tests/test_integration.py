@@ -74,11 +74,10 @@ async def test_scout_cat_file(mock_ssh_config: Path) -> None:
     mock_conn = AsyncMock()
     mock_conn.is_closed = False
 
-    # stat returns file
-    mock_conn.run.side_effect = [
-        MagicMock(stdout="regular file", returncode=0),  # stat
-        MagicMock(stdout="file contents here", returncode=0),  # cat
-    ]
+    # stat and cat run as one command
+    mock_conn.run.return_value = MagicMock(
+        stdout="regular file\nfile contents here", returncode=0
+    )
 
     with patch("asyncssh.connect", new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_conn
@@ -229,11 +228,10 @@ async def test_scout_resource_reads_file(mock_ssh_config: Path) -> None:
     mock_conn = AsyncMock()
     mock_conn.is_closed = False
 
-    # stat returns file, then cat
-    mock_conn.run.side_effect = [
-        MagicMock(stdout="regular file", returncode=0),  # stat
-        MagicMock(stdout="file contents from resource", returncode=0),  # cat
-    ]
+    # stat and cat run as one command
+    mock_conn.run.return_value = MagicMock(
+        stdout="regular file\nfile contents from resource", returncode=0
+    )
 
     with patch("asyncssh.connect", new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_conn
@@ -313,10 +311,7 @@ async def test_scout_resource_normalizes_path(mock_ssh_config: Path) -> None:
     mock_conn.is_closed = False
 
     # Capture the command to verify path normalization
-    mock_conn.run.side_effect = [
-        MagicMock(stdout="regular file", returncode=0),  # stat
-        MagicMock(stdout="content", returncode=0),  # cat
-    ]
+    mock_conn.run.return_value = MagicMock(stdout="regular file\ncontent", returncode=0)
 
     with patch("asyncssh.connect", new_callable=AsyncMock) as mock_connect:
         mock_connect.return_value = mock_conn
@@ -57,3 +57,92 @@ def test_ui_templates_render():
     assert '<!DOCTYPE html>' in md_html
     assert 'Markdown' in md_html
     assert 'marked' in md_html  # marked.js library
+
+
+def test_ui_templates_escape_matches_html_escape():
+    """Template escaping produces the same output as html.escape."""
+    import html
+
+    from scout_mcp.ui.templates import _HTML_ESCAPE_TABLE, get_file_viewer_html
+
+    content = "<script>alert('x' & \"y\")</script>"
+    assert content.translate(_HTML_ESCAPE_TABLE) == html.escape(content)
+
+    file_html = get_file_viewer_html("test", "/file.html", content)
+    assert "<script>alert" not in file_html
+    assert html.escape(content) in file_html
+
+
+def test_markdown_viewer_embeds_source_in_script_block():
+    """Markdown source is shipped raw and cannot close its script block."""
+    from scout_mcp.ui.templates import get_markdown_viewer_html
+
+    content = "# Title\n`code` ${x}\n</script><script>alert(1)</SCRIPT>"
+    md_html = get_markdown_viewer_html("test", "/README.md", content)
+
+    assert 'id="markdownSource" type="text/markdown"' in md_html
+    assert "`code` ${x}" in md_html
+    assert "</script><script>alert(1)" not in md_html
+    assert "<\\/script><script>alert(1)<\\/SCRIPT>" in md_html
+
+
+def test_markdown_viewer_source_round_trips_backslash_variants():
+    """Escaping is reversible, even for text that already looks escaped."""
+    import re
+
+    from scout_mcp.ui.templates import get_markdown_viewer_html
+
+    content = "a</script> b<\\/script c<\\\\/SCRIPT d<!-- e<\\!-- f<\\x"
+    md_html = get_markdown_viewer_html("test", "/README.md", content)
+
+    embedded = re.search(
+        r'id="markdownSource" type="text/markdown">(.*?)</script>', md_html, re.S
+    ).group(1)
+    # Mirrors the viewer's unescape: drop one backslash after "<"
+    assert ".replace(/<\\\\(\\\\*)(\\/script|!--)/gi, '<$1$2')" in md_html
+    restored = re.sub(r"<\\(\\*)(/script|!--)", r"<\1\2", embedded, flags=re.I)
+    assert restored == content
+
+
+def test_minify_html_disabled_by_default(monkeypatch):
+    """HTML is returned untouched unless minification is enabled."""
+    from scout_mcp.ui import templates
+
+    html = "<div>\n    <span>  hi  </span>\n</div>"
+
+    monkeypatch.setattr(templates, "_MINIFY_ENABLED", False)
+    assert templates.minify_html(html) == html
+
+    monkeypatch.setattr(templates, "_MINIFY_ENABLED", True)
+    assert templates.minify_html(html) == "<div><span> hi </span></div>"
+
+
+def test_markdown_viewer_minifies_shell_but_not_content(monkeypatch):
+    """Only the static shell is minified; document whitespace survives."""
+    import re
+
+    from scout_mcp.ui import templates
+
+    monkeypatch.setattr(templates, "_MINIFY_ENABLED", True)
+    parts = re.split(
+        "(__SCOUT_HOST__|__SCOUT_PATH__|__SCOUT_CONTENT__)",
+        templates._build_markdown_viewer_shell(),
+    )
+    monkeypatch.setattr(templates, "_MARKDOWN_VIEWER_PARTS", parts)
+
+    content = "# Title\n\n    indented code\n"
+    md_html = templates.get_markdown_viewer_html("test", "/README.md", content)
+
+    assert content in md_html
+    assert "    " not in md_html.split(content)[0]
+
+
+def test_markdown_viewer_embeds_content_once():
+    """The markdown document appears exactly once in the page."""
+    from scout_mcp.ui.templates import get_markdown_viewer_html
+
+    content = "# Unique heading 7f3a\n\nBody text 7f3a"
+    md_html = get_markdown_viewer_html("test", "/unique.md", content)
+
+    assert md_html.count("7f3a") == 2
+    assert md_html.count(content) == 1
@@ -323,3 +323,20 @@ async def test_logging_middleware_slow_threshold() -> None:
     assert log_level == logging.WARNING
     all_log_calls = str(call_args)
     assert "SLOW!" in all_log_calls
+
+
+@pytest.mark.asyncio
+async def test_logging_middleware_skips_payloads_when_debug_disabled(
+    mock_tool_context: MagicMock,
+) -> None:
+    """Payloads are not serialized when DEBUG logging is filtered out."""
+    mock_logger = MagicMock()
+    mock_logger.isEnabledFor.return_value = False
+    middleware = LoggingMiddleware(logger=mock_logger, include_payloads=True)
+    middleware._truncate = MagicMock(return_value="payload")  # type: ignore[method-assign]
+    call_next = AsyncMock(return_value="result")
+
+    await middleware.on_call_tool(mock_tool_context, call_next)
+
+    middleware._truncate.assert_not_called()
+    mock_logger.debug.assert_not_called()
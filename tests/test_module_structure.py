@@ -112,6 +112,28 @@ class TestUtilsModule:
         assert get_mime_type("/path/to/file.py") == "text/x-python"
         assert get_mime_type("/path/to/file.json") == "application/json"
 
+    def test_utils_reexports_are_lazy(self) -> None:
+        """Importing one utility does not load unrelated utility modules."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from scout_mcp.utils import parse_target\n"
+            "assert 'scout_mcp.utils.console' not in sys.modules\n"
+            "assert 'scout_mcp.utils.ping' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_utils_attribute_raises(self) -> None:
+        """Unknown names still raise AttributeError."""
+        import pytest
+
+        import scout_mcp.utils
+
+        with pytest.raises(AttributeError):
+            _ = scout_mcp.utils.does_not_exist
+
 
 class TestToolsModule:
     """Tests for scout_mcp.tools package."""
@@ -1,57 +1,123 @@
 """Tests for host connectivity checking."""
 
 import asyncio
+import socket
 import time
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Awaitable, Callable
+from contextlib import contextmanager
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 
 from scout_mcp.utils.ping import check_host_online, check_hosts_online
 
 
+@contextmanager
+def mock_tcp_connect(connect: Callable[[str], Awaitable[None]]) -> Any:
+    """Patch address resolution and socket connects on the running loop.
+
+    ``connect`` receives the target hostname and raises to simulate failure.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def fake_getaddrinfo(host: str, port: int, **kwargs: Any) -> list:
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (host, port))]
+
+    async def fake_sock_connect(sock: socket.socket, address: tuple) -> None:
+        await connect(address[0])
+
+    with (
+        patch.object(loop, "getaddrinfo", side_effect=fake_getaddrinfo),
+        patch.object(loop, "sock_connect", side_effect=fake_sock_connect),
+    ):
+        yield
+
+
 @pytest.mark.asyncio
 async def test_check_host_online_reachable() -> None:
     """Returns True when host is reachable."""
-    mock_writer = MagicMock()
-    mock_writer.close = MagicMock()
-    mock_writer.wait_closed = AsyncMock()
 
-    with patch("asyncio.open_connection", new_callable=AsyncMock) as mock_conn:
-        mock_conn.return_value = (MagicMock(), mock_writer)
+    async def connect(host: str) -> None:
+        return None
 
+    with mock_tcp_connect(connect):
         result = await check_host_online("192.168.1.1", 22)
 
-        assert result is True
+    assert result is True
 
 
 @pytest.mark.asyncio
 async def test_check_host_online_unreachable() -> None:
     """Returns False when host is unreachable."""
-    with patch("asyncio.open_connection", new_callable=AsyncMock) as mock_conn:
-        mock_conn.side_effect = TimeoutError()
 
+    async def connect(host: str) -> None:
+        raise ConnectionRefusedError()
+
+    with mock_tcp_connect(connect):
         result = await check_host_online("192.168.1.1", 22)
 
-        assert result is False
+    assert result is False
+
+
+@pytest.mark.asyncio
+async def test_check_host_online_tries_every_address() -> None:
+    """Falls back to later addresses when the first one refuses."""
+    loop = asyncio.get_running_loop()
+    addresses = [
+        (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("::1", 22, 0, 0)),
+        (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", 22)),
+    ]
+    attempted: list[str] = []
+
+    async def fake_sock_connect(sock: socket.socket, address: tuple) -> None:
+        attempted.append(address[0])
+        if address[0] == "::1":
+            raise ConnectionRefusedError()
+
+    with (
+        patch.object(loop, "getaddrinfo", return_value=addresses),
+        patch.object(loop, "sock_connect", side_effect=fake_sock_connect),
+    ):
+        result = await check_host_online("localhost", 22)
+
+    assert result is True
+    assert attempted == ["::1", "127.0.0.1"]
+
+
+@pytest.mark.asyncio
+async def test_check_host_online_times_out() -> None:
+    """Returns False when the connect exceeds the timeout."""
+
+    async def connect(host: str) -> None:
+        await asyncio.sleep(1)
+
+    with mock_tcp_connect(connect):
+        result = await check_host_online("192.168.1.1", 22, timeout=0.01)
+
+    assert result is False
+
+
+@pytest.mark.asyncio
+async def test_check_host_online_unresolvable() -> None:
+    """Returns False when the hostname cannot be resolved."""
+    loop = asyncio.get_running_loop()
+
+    with patch.object(loop, "getaddrinfo", side_effect=socket.gaierror()):
+        result = await check_host_online("no-such-host.invalid", 22)
+
+    assert result is False
 
 
 @pytest.mark.asyncio
 async def test_check_hosts_online_multiple() -> None:
     """Checks multiple hosts and returns status dict."""
-    mock_writer = MagicMock()
-    mock_writer.close = MagicMock()
-    mock_writer.wait_closed = AsyncMock()
 
-    call_count = 0
+    async def connect(host: str) -> None:
+        if host != "192.168.1.1":
+            raise TimeoutError()
 
-    async def mock_open_connection(host: str, port: int) -> tuple:
-        nonlocal call_count
-        call_count += 1
-        if host == "192.168.1.1":
-            return (MagicMock(), mock_writer)
-        raise TimeoutError()
-
-    with patch("asyncio.open_connection", side_effect=mock_open_connection):
+    with mock_tcp_connect(connect):
         hosts = {
             "online_host": ("192.168.1.1", 22),
             "offline_host": ("192.168.1.2", 22),
@@ -70,14 +136,10 @@ async def test_check_hosts_online_runs_concurrently() -> None:
     # If concurrent, should complete in ~0.1s
     delay_per_host = 0.1
 
-    async def slow_check(host: str, port: int) -> tuple:
+    async def slow_connect(host: str) -> None:
         await asyncio.sleep(delay_per_host)
-        mock_writer = MagicMock()
-        mock_writer.close = MagicMock()
-        mock_writer.wait_closed = AsyncMock()
-        return (MagicMock(), mock_writer)
 
-    with patch("asyncio.open_connection", side_effect=slow_check):
+    with mock_tcp_connect(slow_connect):
         hosts = {
             "host1": ("192.168.1.1", 22),
             "host2": ("192.168.1.2", 22),
@@ -94,3 +156,26 @@ async def test_check_hosts_online_runs_concurrently() -> None:
         )
         assert len(results) == 3
         assert all(results.values())
+
+
+@pytest.mark.asyncio
+async def test_check_hosts_online_respects_max_concurrency() -> None:
+    """No more than max_concurrency checks run at the same time."""
+    in_flight = 0
+    peak = 0
+
+    async def tracked_connect(host: str) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    with mock_tcp_connect(tracked_connect):
+        hosts = {f"host{i}": (f"10.0.0.{i}", 22) for i in range(10)}
+
+        results = await check_hosts_online(hosts, max_concurrency=3)
+
+        assert peak == 3
+        assert len(results) == 10
+        assert all(results.values())
@@ -70,6 +70,7 @@ class TestPoolConcurrency:
 
         # Should only create one connection
         assert pool.pool_size == 1
+        assert pool.connections_created == 1
         # Both should get the same connection
         assert results[0] == results[1]
 
@@ -161,3 +162,53 @@ class TestPoolConcurrency:
         )
 
         assert pool.pool_size == 2
+
+    def test_host_lock_is_per_host_and_stable(self, pool):
+        """Each host gets one lock, and distinct hosts get distinct locks."""
+        lock1 = pool._get_host_lock("host1")
+
+        assert pool._get_host_lock("host1") is lock1
+        assert pool._get_host_lock("host2") is not lock1
+
+    @pytest.mark.asyncio
+    async def test_host_lock_lookup_skips_meta_lock(self, pool):
+        """Looking up a host lock does not wait on the pool-wide meta-lock."""
+        async with pool._meta_lock:
+            lock = pool._get_host_lock("host1")
+
+        assert isinstance(lock, asyncio.Lock)
+
+    @pytest.mark.asyncio
+    async def test_warm_opens_hosts_in_parallel(self, mock_asyncssh, pool):
+        """Pre-warming connects to every host concurrently."""
+        hosts = [
+            SSHHost(name=f"host{i}", hostname=f"h{i}", user="u", port=22)
+            for i in range(3)
+        ]
+
+        start = asyncio.get_event_loop().time()
+        warmed = await pool.warm(hosts)
+        elapsed = asyncio.get_event_loop().time() - start
+
+        assert warmed == 3
+        assert pool.pool_size == 3
+        assert elapsed < 0.2, f"Expected parallel warm-up, got {elapsed:.3f}s"
+
+    @pytest.mark.asyncio
+    async def test_warm_skips_failed_hosts(self, pool):
+        """A host that fails to connect does not stop the others warming."""
+
+        async def flaky_connect(host, **kwargs):
+            if host == "bad":
+                raise OSError("unreachable")
+            return MagicMock(is_closed=False)
+
+        good = SSHHost(name="good", hostname="good", user="u", port=22)
+        bad = SSHHost(name="bad", hostname="bad", user="u", port=22)
+
+        with patch("scout_mcp.services.pool.asyncssh") as mock:
+            mock.connect = flaky_connect
+            warmed = await pool.warm([good, bad])
+
+        assert warmed == 1
+        assert pool.active_hosts == ["good"]
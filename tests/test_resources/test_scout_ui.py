@@ -26,8 +26,8 @@ async def test_scout_resource_returns_ui_for_directory(monkeypatch):
         AsyncMock(return_value=mock_conn)
     )
     monkeypatch.setattr(
-        "scout_mcp.resources.scout.stat_path",
-        AsyncMock(return_value="directory")
+        "scout_mcp.resources.scout.stat_and_cat",
+        AsyncMock(return_value=("directory", "", False))
     )
     monkeypatch.setattr(
         "scout_mcp.resources.scout.ls_dir",
@@ -63,12 +63,8 @@ async def test_scout_resource_returns_ui_for_markdown(monkeypatch):
         AsyncMock(return_value=mock_conn)
     )
     monkeypatch.setattr(
-        "scout_mcp.resources.scout.stat_path",
-        AsyncMock(return_value="file")
-    )
-    monkeypatch.setattr(
-        "scout_mcp.resources.scout.cat_file",
-        AsyncMock(return_value=("# Hello", False))
+        "scout_mcp.resources.scout.stat_and_cat",
+        AsyncMock(return_value=("file", "# Hello", False))
     )
 
     result = await scout_resource("tootie", "/docs/README.md")
@@ -98,12 +94,8 @@ async def test_scout_resource_returns_ui_for_logs(monkeypatch):
         AsyncMock(return_value=mock_conn)
     )
     monkeypatch.setattr(
-        "scout_mcp.resources.scout.stat_path",
-        AsyncMock(return_value="file")
-    )
-    monkeypatch.setattr(
-        "scout_mcp.resources.scout.cat_file",
-        AsyncMock(return_value=("[2025-12-07] INFO: test", False))
+        "scout_mcp.resources.scout.stat_and_cat",
+        AsyncMock(return_value=("file", "[2025-12-07] INFO: test", False))
     )
 
     result = await scout_resource("tootie", "/var/log/app.log")
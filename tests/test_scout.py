@@ -1,13 +1,15 @@
 """Tests for scout URI parsing and intent detection."""
 
+import dataclasses
 import tempfile
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from scout_mcp.tools.scout import scout
 from scout_mcp.utils.parser import parse_target
+from tests._mocks import MockSSHFactory
 
 
 def test_parse_target_file_uri() -> None:
@@ -60,6 +62,15 @@ def test_parse_target_empty_host_raises() -> None:
         parse_target(":/var/log")
 
 
+def test_parse_target_returns_cached_frozen_result() -> None:
+    """Repeated targets share one immutable parse result."""
+    first = parse_target("dookie:/var/log/app.log")
+
+    assert parse_target("dookie:/var/log/app.log") is first
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.path = "/etc/shadow"  # type: ignore[misc]
+
+
 # Beam (file transfer) tests
 
 
@@ -77,7 +88,9 @@ Host testhost
 
 
 @pytest.mark.asyncio
-async def test_scout_beam_upload(mock_ssh_config: Path) -> None:
+async def test_scout_beam_upload(
+    mock_ssh_config: Path, mock_ssh_factory: MockSSHFactory
+) -> None:
     """Test beam parameter for uploading files."""
     from scout_mcp.config import Config
     from scout_mcp.services import reset_state, set_config
@@ -91,19 +104,7 @@ async def test_scout_beam_upload(mock_ssh_config: Path) -> None:
         local_path = f.name
 
     try:
-        # Mock SSH connection and SFTP
-        mock_conn = AsyncMock()
-        mock_conn.is_closed = False
-
-        # Mock SFTP client as async context manager
-        mock_sftp = AsyncMock()
-        mock_sftp.put = AsyncMock()
-
-        # Mock the start_sftp_client() to return a proper async context manager
-        mock_sftp_ctx = AsyncMock()
-        mock_sftp_ctx.__aenter__ = AsyncMock(return_value=mock_sftp)
-        mock_sftp_ctx.__aexit__ = AsyncMock(return_value=None)
-        mock_conn.start_sftp_client = MagicMock(return_value=mock_sftp_ctx)
+        mock_conn, mock_sftp = mock_ssh_factory()
 
         with patch("asyncssh.connect", new_callable=AsyncMock) as mock_connect:
             mock_connect.return_value = mock_conn
@@ -119,7 +120,9 @@ async def test_scout_beam_upload(mock_ssh_config: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_scout_beam_download(mock_ssh_config: Path) -> None:
+async def test_scout_beam_download(
+    mock_ssh_config: Path, mock_ssh_factory: MockSSHFactory
+) -> None:
     """Test beam parameter for downloading files."""
     from scout_mcp.config import Config
     from scout_mcp.services import reset_state, set_config
@@ -130,24 +133,11 @@ async def test_scout_beam_download(mock_ssh_config: Path) -> None:
     with tempfile.TemporaryDirectory() as tmpdir:
         local_path = f"{tmpdir}/downloaded.txt"
 
-        # Mock SSH connection and SFTP
-        mock_conn = AsyncMock()
-        mock_conn.is_closed = False
-
-        # Mock SFTP client as async context manager
-        mock_sftp = AsyncMock()
-
         # Mock get() to create the file so the handler can stat it
         async def mock_get(src: str, dst: str) -> None:
             Path(dst).write_text("mock content\n")
 
-        mock_sftp.get = AsyncMock(side_effect=mock_get)
-
-        # Mock the start_sftp_client() to return a proper async context manager
-        mock_sftp_ctx = AsyncMock()
-        mock_sftp_ctx.__aenter__ = AsyncMock(return_value=mock_sftp)
-        mock_sftp_ctx.__aexit__ = AsyncMock(return_value=None)
-        mock_conn.start_sftp_client = MagicMock(return_value=mock_sftp_ctx)
+        mock_conn, mock_sftp = mock_ssh_factory(get_side_effect=mock_get)
 
         with patch("asyncssh.connect", new_callable=AsyncMock) as mock_connect:
             mock_connect.return_value = mock_conn
@@ -4,7 +4,7 @@ import shlex
 
 import pytest
 
-from scout_mcp.utils.shell import quote_arg, quote_path
+from scout_mcp.utils.shell import _quote, quote_arg, quote_path
 from scout_mcp.utils.validation import (
     PathTraversalError,
     validate_host_format,
@@ -162,6 +162,18 @@ class TestShellQuoting:
         # And no command injection is possible
         assert "rm" not in [safe_parts[0]]
 
+    def test_quote_cache_is_bounded(self):
+        """Test that repeated quoting is cached without unbounded growth."""
+        _quote.cache_clear()
+        assert quote_path("/var/log/my file") == quote_arg("/var/log/my file")
+        assert _quote.cache_info().hits == 1
+
+        for i in range(1000):
+            quote_arg(f"arg {i}")
+        info = _quote.cache_info()
+        assert info.maxsize is not None
+        assert info.currsize <= info.maxsize
+
 
 class TestPathTraversalProtection:
     """Test path traversal protection in validation."""
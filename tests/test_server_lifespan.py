@@ -69,11 +69,9 @@ async def test_read_host_path_reads_file(mock_ssh_config: Path) -> None:
 
     # Mock the SSH connection and pool
     mock_conn = AsyncMock()
+    # stat and cat run as one command
     mock_conn.run = AsyncMock(
-        side_effect=[
-            MagicMock(stdout="regular file", returncode=0),  # stat call
-            MagicMock(stdout="file contents here", returncode=0),  # cat call
-        ]
+        return_value=MagicMock(stdout="regular file\nfile contents here", returncode=0)
     )
 
     mock_pool = AsyncMock()
@@ -168,11 +166,9 @@ async def test_dynamic_resource_integration(mock_ssh_config: Path) -> None:
 
     # Mock the SSH connection and pool
     mock_conn = AsyncMock()
+    # stat and cat run as one command
     mock_conn.run = AsyncMock(
-        side_effect=[
-            MagicMock(stdout="regular file", returncode=0),  # stat call
-            MagicMock(stdout="test file contents", returncode=0),  # cat call
-        ]
+        return_value=MagicMock(stdout="regular file\ntest file contents", returncode=0)
     )
 
     mock_pool = AsyncMock()
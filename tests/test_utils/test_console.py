@@ -0,0 +1,148 @@
+"""Tests for colorful console logging formatters."""
+
+import logging
+
+from scout_mcp.utils.console import _COMPONENT_CACHE, COLORS, ColorfulFormatter
+
+
+def make_record(msg: str, name: str = "scout_mcp.server") -> logging.LogRecord:
+    """Build a log record for formatter tests."""
+    return logging.LogRecord(name, logging.INFO, __file__, 1, msg, None, None)
+
+
+def test_highlight_message_wraps_patterns():
+    """URIs, durations, SSH targets and pool sizes are highlighted."""
+    formatter = ColorfulFormatter()
+    reset = COLORS["reset"]
+
+    message = formatter._highlight_message(
+        "tool:scout read tootie://etc in 12.5ms via root@tootie:22 pool_size=3"
+    )
+
+    assert f"{COLORS['bright_cyan']}tool:scout{reset}" in message
+    assert f"{COLORS['bright_blue']}tootie://etc{reset}" in message
+    assert f"{COLORS['bright_yellow']}12.5ms{reset}" in message
+    assert f"{COLORS['bright_magenta']}root@tootie:22{reset}" in message
+    assert f"{COLORS['cyan']}pool_size=3{reset}" in message
+
+
+def test_highlight_message_without_colors_is_unchanged():
+    """Highlighting is skipped when colors are disabled."""
+    formatter = ColorfulFormatter(use_colors=False)
+    message = "read tootie://etc in 12.5ms"
+    assert formatter._highlight_message(message) == message
+
+
+def test_format_without_colors():
+    """Plain output contains level, shortened component and message."""
+    formatter = ColorfulFormatter(use_colors=False)
+    line = formatter.format(make_record("hello world"))
+
+    assert "\033[" not in line
+    assert "| INFO     | server               | hello world" in line
+
+
+def test_format_timestamp_uses_est():
+    """Timestamps render in EST within and across seconds."""
+    formatter = ColorfulFormatter(use_colors=False)
+
+    # 2025-01-15 17:30:45 UTC == 12:30:45 EST
+    record = make_record("first")
+    record.created = 1736962245.25
+    record.msecs = 250.0
+    assert formatter._format_timestamp(record) == "12:30:45.250 01/15"
+
+    later = make_record("second")
+    later.created = 1736962245.75
+    later.msecs = 750.0
+    assert formatter._format_timestamp(later) == "12:30:45.750 01/15"
+
+    next_second = make_record("third")
+    next_second.created = 1736962246.0
+    next_second.msecs = 0.0
+    assert formatter._format_timestamp(next_second) == "12:30:46.000 01/15"
+
+
+def test_component_color_matches_prefix():
+    """Component colors resolve by logger-name prefix and are cached."""
+    formatter = ColorfulFormatter()
+
+    name = "scout_mcp.services.pool.x"
+    assert formatter._get_component_color(name) == COLORS["bright_magenta"]
+    assert _COMPONENT_CACHE[name] is formatter._get_component(name)
+    assert formatter._get_component_color("uvicorn.error") == COLORS["white"]
+    assert formatter._get_component("scout_mcp.config.parser") == (
+        "config.parser",
+        COLORS["green"],
+    )
+
+
+def test_mcp_formatter_formats_message_args_once():
+    """MCPRequestFormatter reuses the message formatted by the base class."""
+    from scout_mcp.utils.console import MCPRequestFormatter
+
+    calls = []
+
+    class Arg:
+        def __str__(self) -> str:
+            calls.append(1)
+            return "pool"
+
+    record = make_record("Creating %s connection")
+    record.args = (Arg(),)
+    line = MCPRequestFormatter().format(record)
+
+    assert "Creating pool connection" in line
+    assert line.startswith(f"{COLORS['bright_cyan']}+{COLORS['reset']}")
+    assert len(calls) == 1
+
+
+def test_mcp_formatter_event_indicator_priority():
+    """Event indicators follow category priority, not keyword position."""
+    from scout_mcp.utils.console import MCPRequestFormatter
+
+    formatter = MCPRequestFormatter()
+    reset = COLORS["reset"]
+
+    failed_start = formatter.format(make_record("Connection failed while starting"))
+    assert failed_start.startswith(f"{COLORS['bright_green']}>>>{reset} ")
+
+    reuse = formatter.format(make_record("Reusing connection"))
+    assert reuse.startswith(f"{COLORS['bright_magenta']}~{reset}   ")
+
+    plain = formatter.format(make_record("Nothing notable"))
+    assert plain.startswith("    ")
+
+
+def test_format_timestamp_matches_zoneinfo_across_dst_and_midnight():
+    """Hour-cached timestamps agree with zoneinfo at DST and day boundaries."""
+    from datetime import datetime
+
+    from scout_mcp.utils.console import EST
+
+    formatter = ColorfulFormatter(use_colors=False)
+    # Spring forward, fall back, and EST midnight
+    for created in (1741503599, 1741503600, 1762063199, 1762063200, 1736917199):
+        for offset in (0, 1, 59, 3599):
+            record = make_record("tick")
+            record.created = float(created + offset)
+            record.msecs = 0.0
+            expected = datetime.fromtimestamp(record.created, tz=EST).strftime(
+                "%H:%M:%S.000 %m/%d"
+            )
+            assert formatter._format_timestamp(record) == expected
+
+
+def test_format_with_colors_renders_columns():
+    """Colored output wraps each column with its color and a reset."""
+    formatter = ColorfulFormatter()
+    reset = COLORS["reset"]
+    sep = f"{COLORS['dim']}|{reset}"
+
+    record = make_record("hello", name="scout_mcp.config")
+    record.levelname = "WARNING"
+    line = formatter.format(record)
+
+    assert line.startswith(COLORS["dim"])
+    assert f" {sep} {COLORS['bright_yellow']}WARNING {reset} {sep} " in line
+    assert f"{COLORS['green']}{'config':<20}{reset} {sep} hello" in line
@@ -36,3 +36,38 @@ def test_is_localhost_target_handles_fqdn():
     if "." in server_hostname:
         short_name = server_hostname.split(".")[0]
         assert is_localhost_target(short_name) is True
+
+
+def test_get_server_hostname_is_cached(monkeypatch):
+    """Hostname lookup should only hit the socket module once."""
+    import socket
+
+    calls = []
+
+    def fake_gethostname():
+        calls.append(1)
+        return "Cached-Host"
+
+    monkeypatch.setattr(socket, "gethostname", fake_gethostname)
+    get_server_hostname.cache_clear()
+    try:
+        assert get_server_hostname() == "cached-host"
+        assert get_server_hostname() == "cached-host"
+        assert len(calls) == 1
+    finally:
+        get_server_hostname.cache_clear()
+
+
+def test_is_localhost_target_fqdn_rules(monkeypatch):
+    """Short and FQDN forms match only against the server's own name."""
+    from scout_mcp.utils import hostname
+
+    monkeypatch.setattr(hostname, "get_server_hostname", lambda: "tootie.lan")
+    assert is_localhost_target("tootie.lan") is True
+    assert is_localhost_target("TOOTIE") is True
+    assert is_localhost_target("tootie.example.com") is False
+    assert is_localhost_target("") is False
+
+    monkeypatch.setattr(hostname, "get_server_hostname", lambda: "tootie")
+    assert is_localhost_target("tootie.example.com") is True
+    assert is_localhost_target("squirts.example.com") is False
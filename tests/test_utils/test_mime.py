@@ -0,0 +1,18 @@
+"""Tests for MIME type detection."""
+
+from scout_mcp.utils.mime import get_mime_type
+
+
+def test_get_mime_type_known_extensions():
+    """Known extensions map to their MIME types case-insensitively."""
+    assert get_mime_type("/etc/app/config.YAML") == "text/yaml"
+    assert get_mime_type("/srv/www/index.htm") == "text/html"
+    assert get_mime_type("/srv/www/index.html") == "text/html"
+    assert get_mime_type("/opt/release.v1.2/README.md") == "text/markdown"
+
+
+def test_get_mime_type_defaults_to_text_plain():
+    """Unknown or missing extensions fall back to text/plain."""
+    assert get_mime_type("/usr/bin/python3") == "text/plain"
+    assert get_mime_type("/tmp/archive.tar.gz") == "text/plain"
+    assert get_mime_type("/home/user/.bashrc") == "text/plain"
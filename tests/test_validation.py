@@ -98,6 +98,25 @@ class TestValidatePath:
         # os.path.normpath removes . components
         assert validate_path("/var/./log/./app.log") == "/var/log/app.log"
 
+    def test_normalization_trailing_and_leading_dot(self):
+        """Test that trailing slashes and leading ./ are still normalized."""
+        assert validate_path("/var/log/") == "/var/log"
+        assert validate_path("./app.log") == "app.log"
+        assert validate_path("/var/log/.") == "/var/log"
+        assert validate_path("/") == "/"
+
+    def test_traversal_detected_deep_in_long_path(self):
+        """Test that traversal is caught past the start of a long path."""
+        with pytest.raises(PathTraversalError):
+            validate_path("/very/long/path" * 20 + "/../etc/passwd")
+        with pytest.raises(PathTraversalError):
+            validate_path("..")
+
+    def test_clean_path_returned_unchanged(self):
+        """Test that already-canonical paths skip normalization."""
+        path = "/var/log/app.log"
+        assert validate_path(path) is path
+
 
 class TestValidateHost:
     """Test host validation."""